@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 try:
     from importlib.metadata import PackageNotFoundError, version
 except ImportError:  # pragma: no cover
@@ -8,10 +10,23 @@ try:  # pragma: no cover
 except PackageNotFoundError:  # pragma: no cover
     __version__ = "0.0.0"
 
-from .cli import main
-from .core import GreatDocs
+from .core import GreatDocs, build_all
+
+if TYPE_CHECKING:
+    from .cli import main
 
 __all__ = [
     "GreatDocs",
+    "build_all",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI (and with it click) is only imported when `main` is first requested, so
+    # `from great_docs import GreatDocs` doesn't pay for it
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
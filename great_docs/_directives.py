@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class DocDirectives:
     """
     Extracted directives from a docstring.
@@ -28,7 +28,7 @@ class DocDirectives:
 
     def __bool__(self) -> bool:
         """Return True if any directive was found."""
-        return bool(self.family or self.order is not None or self.seealso or self.nodoc)
+        return bool(self.nodoc or self.family or self.order is not None or self.seealso)
 
 
 # Single-line directive patterns (with % prefix, no colon)
@@ -45,6 +45,53 @@ ALL_DIRECTIVES_PATTERN = re.compile(
     r"^\s*%(?:family|order|seealso|nodoc)(?:\s+.*)?$\n?", re.MULTILINE | re.IGNORECASE
 )
 
+# Any directive line, capturing the directive name and its (possibly empty) value; used
+# to read all directives in a single pass over the docstring
+_DIRECTIVE_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*%(family|order|seealso|nodoc)(?:[^\S\n]+(.*?))?[^\S\n]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Values of %nodoc that mean "exclude" (a bare %nodoc does too)
+_NODOC_VALUES = frozenset({"", "true", "yes", "1"})
+
+# Any directive name after a % sign, wherever it appears; the literal "%" prefix lets
+# the regex engine skip ahead to candidates instead of trying every line start
+_DIRECTIVE_MARKER_PATTERN = re.compile(r"%(?:family|order|seealso|nodoc)", re.IGNORECASE)
+
+# Runs of three or more newlines left behind after directive lines are removed
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
+def _may_have_directives(docstring: str | None) -> bool:
+    """Cheaply rule out docstrings that cannot hold a directive (no "%" character at all)."""
+    return bool(docstring) and "%" in docstring
+
+
+def _record_directive(directives: DocDirectives, seen: set[str], match: re.Match) -> None:
+    """Store the directive in a `_DIRECTIVE_LINE_PATTERN` match unless one was already set."""
+    name, value = match.group(1), match.group(2) or ""
+
+    if name == "family":
+        if name not in seen and value:
+            directives.family = value
+            seen.add(name)
+
+    elif name == "order":
+        if name not in seen and value.isdecimal():
+            directives.order = int(value)
+            seen.add(name)
+
+    elif name == "seealso":
+        # Comma-separated list
+        if name not in seen and value:
+            items = [item.strip() for item in value.split(",")]
+            directives.seealso = [item for item in items if item]
+            seen.add(name)
+
+    elif name.lower() == "nodoc" and value.lower() in _NODOC_VALUES:
+        directives.nodoc = True
+
 
 def extract_directives(docstring: str | None) -> DocDirectives:
     """
@@ -83,25 +130,13 @@ def extract_directives(docstring: str | None) -> DocDirectives:
     """
     directives = DocDirectives()
 
-    if not docstring:
+    if not _may_have_directives(docstring):
         return directives
 
-    # Extract %family
-    if match := DIRECTIVE_PATTERNS["family"].search(docstring):
-        directives.family = match.group(1).strip()
-
-    # Extract %order
-    if match := DIRECTIVE_PATTERNS["order"].search(docstring):
-        directives.order = int(match.group(1))
-
-    # Extract %seealso (comma-separated list)
-    if match := DIRECTIVE_PATTERNS["seealso"].search(docstring):
-        items = [item.strip() for item in match.group(1).split(",")]
-        directives.seealso = [item for item in items if item]
-
-    # Extract %nodoc
-    if DIRECTIVE_PATTERNS["nodoc"].search(docstring):
-        directives.nodoc = True
+    # Read every directive line in one pass; the first valid occurrence of each wins
+    seen: set[str] = set()
+    for match in _DIRECTIVE_LINE_PATTERN.finditer(docstring):
+        _record_directive(directives, seen, match)
 
     return directives
 
@@ -146,16 +181,65 @@ def strip_directives(docstring: str | None) -> str:
     if not docstring:
         return docstring or ""
 
-    # Remove all directive lines
-    cleaned = ALL_DIRECTIVES_PATTERN.sub("", docstring)
+    # Remove all directive lines (there can be none without a "%" in the docstring)
+    cleaned = docstring
+    if _may_have_directives(docstring):
+        cleaned = ALL_DIRECTIVES_PATTERN.sub("", docstring)
 
     # Clean up resulting multiple blank lines (more than 2 newlines -> 2 newlines)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    cleaned = _EXCESS_NEWLINES_PATTERN.sub("\n\n", cleaned)
 
     # Strip leading/trailing whitespace but preserve internal structure
     return cleaned.strip()
 
 
+def extract_and_strip(docstring: str | None) -> tuple[DocDirectives, str]:
+    """
+    Extract Great Docs directives from a docstring and remove them in one pass.
+
+    This gives the same results as calling `extract_directives()` and
+    `strip_directives()` on the same docstring, but only scans it once.
+
+    Parameters
+    ----------
+    docstring
+        The docstring to process. Can be None.
+
+    Returns
+    -------
+    tuple[DocDirectives, str]
+        The extracted directives and the docstring with all %directive lines removed.
+
+    Examples
+    --------
+    >>> directives, cleaned = extract_and_strip("Summary.\\n\\n%family Tools\\n")
+    >>> directives.family
+    'Tools'
+    >>> cleaned
+    'Summary.'
+    """
+    directives = DocDirectives()
+
+    if not docstring:
+        return directives, docstring or ""
+
+    if not _may_have_directives(docstring):
+        return directives, _EXCESS_NEWLINES_PATTERN.sub("\n\n", docstring).strip()
+
+    seen: set[str] = set()
+
+    def remove_directive(match: re.Match) -> str:
+        # A removed span can hold several directive lines, so read each of them
+        for line in _DIRECTIVE_LINE_PATTERN.finditer(match.group()):
+            _record_directive(directives, seen, line)
+        return ""
+
+    cleaned = ALL_DIRECTIVES_PATTERN.sub(remove_directive, docstring)
+    cleaned = _EXCESS_NEWLINES_PATTERN.sub("\n\n", cleaned)
+
+    return directives, cleaned.strip()
+
+
 def has_directives(docstring: str | None) -> bool:
     """
     Check if a docstring contains any Great Docs directives.
@@ -170,7 +254,8 @@ def has_directives(docstring: str | None) -> bool:
     bool
         True if any %directive pattern is found.
     """
-    if not docstring:
+    if not _may_have_directives(docstring) or not _DIRECTIVE_MARKER_PATTERN.search(docstring):
         return False
 
+    # Only a marker at the start of a line is a directive
     return bool(ALL_DIRECTIVES_PATTERN.search(docstring))
@@ -1,10 +1,320 @@
+import copy
+import filecmp
 import os
 import re
 import shutil
-from importlib import resources
+import tomllib
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
+from typing import Any
+
+# Captures the body of the `[project]` table in a pyproject.toml (up to the next table header)
+_PROJECT_TABLE_RE = re.compile(rb"(?ms)^\[project\][ \t]*(?:#[^\n]*)?$(.*?)(?=^[ \t]*\[|\Z)")
+
+# Top-level `__all__ = [...]` and `__gt_exclude__ = [...]` list literals in an __init__.py,
+# where the list is the whole right-hand side (only a comment may follow the `]`)
+_DUNDER_LIST_RES = {
+    name: re.compile(
+        rb"(?m)^" + name.encode() + rb"[ \t]*=[ \t]*(\[[^\]]*\])[ \t]*(?:#[^\n]*)?\r?$"
+    )
+    for name in ("__all__", "__gt_exclude__")
+}
+
+# Markdown ATX headings (levels 1-6) at the start of a line, with the following whitespace
+_ATX_HEADING_RE = re.compile(r"^(#{1,6})\s+", re.MULTILINE)
+
+# Matches `name="..."` in a setup.py `setup()` call
+_SETUP_NAME_RE = re.compile(r'name\s*=\s*["\']([^"\']+)["\']')
+
+# Owner and repository in a GitHub URL (https://github.com/o/r, git@github.com:o/r.git)
+_GITHUB_REPO_RE = re.compile(r"github\.com[/:]([^/]+)/([^/\s.]+)")
+
+# griffe object kinds that are documented as class methods
+_METHOD_KINDS = frozenset({"function", "method"})
+
+# Project-relative locations of the files great-docs installs and registers in _quarto.yml
+_POST_RENDER_SCRIPT = "scripts/post-render.py"
+_GREAT_DOCS_CSS = "great-docs.css"
+
+# Frames of the progress spinner shown while Quarto runs
+_SPINNER = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+
+
+@cache
+def _yaml_safe_classes() -> tuple[type, type]:
+    """
+    Import PyYAML on first use and return its fastest safe (Loader, Dumper) pair.
+
+    PyYAML is imported lazily so that commands which never touch YAML (like
+    `great-docs --help`) don't pay for it. The LibYAML-backed classes are used when
+    available, which is the case for the standard PyYAML wheels.
+    """
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+
+        return CSafeLoader, CSafeDumper
+    except ImportError:  # pragma: no cover
+        from yaml import SafeDumper, SafeLoader
+
+        return SafeLoader, SafeDumper
+
+
+def _parse_yaml(stream) -> Any:
+    """Parse a YAML document from bytes, a string, or a file object."""
+    import yaml
+
+    loader, _ = _yaml_safe_classes()
+    return yaml.load(stream, Loader=loader)
+
+
+def _emit_yaml(data: Any) -> bytes:
+    """Serialize `data` to block-style, UTF-8 encoded YAML, preserving key order."""
+    import yaml
+
+    _, dumper = _yaml_safe_classes()
+    return yaml.dump(
+        data, Dumper=dumper, default_flow_style=False, sort_keys=False, encoding="utf-8"
+    )
+
+
+def _pyproject_name(data: bytes) -> str | None:
+    """
+    Return `project.name` from the raw bytes of a pyproject.toml.
+
+    Only the `[project]` table is handed to tomllib when it can be located, so the
+    (often much larger) `[tool.*]` sections aren't parsed. The whole document is
+    parsed as a fallback, e.g. when the name is set with a dotted key.
+    """
+    match = _PROJECT_TABLE_RE.search(data)
+    if match:
+        try:
+            name = tomllib.loads(match.group(1).decode("utf-8")).get("name")
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+            name = None
+        if isinstance(name, str):
+            return name
+
+    try:
+        project = tomllib.loads(data.decode("utf-8")).get("project", {})
+    except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+        return None
+    return project.get("name") if isinstance(project, dict) else None
+
+
+def _scan_string_list(source: bytes, name: str) -> list[str] | None:
+    """
+    Read a `name = [...]` list of strings from module source without parsing the module.
+
+    Returns an empty list when `name` doesn't appear at all, and None when the
+    assignment isn't a single plain list of strings (e.g., it's a tuple, it's extended
+    later with `+=`, or it's built dynamically), in which case the caller should fall
+    back to a full AST parse.
+    """
+    if source.count(name.encode()) == 0:
+        return []
+    if source.count(name.encode()) > 1:
+        return None
+
+    match = _DUNDER_LIST_RES[name].search(source)
+    if match is None:
+        return None
+
+    import ast
+
+    try:
+        value = ast.literal_eval(match.group(1).decode("utf-8"))
+    except (ValueError, SyntaxError, UnicodeDecodeError):
+        return None
+    if not all(isinstance(item, str) for item in value):
+        return None
+    return value
+
+
+# Parsed YAML files, keyed by path and validated against the file's (mtime, size)
+_YAML_CACHE: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
+_YAML_CACHE_MAXSIZE = 100
+
+
+def _remember_yaml(path: Path, config: dict) -> None:
+    """Store a copy of the parsed contents of `path` in the YAML cache."""
+    stat = path.stat()
+    _YAML_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(config))
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAXSIZE:
+        _YAML_CACHE.popitem(last=False)
+
+
+def _load_yaml(path: Path) -> dict:
+    """
+    Load a YAML mapping from `path`, reusing the previous parse if the file is unchanged.
+
+    The returned dict is a private copy, so callers are free to mutate it.
+    """
+    stat = path.stat()
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        _YAML_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    # The parser decodes UTF-8 (or BOM-marked UTF-16) bytes itself
+    config = _parse_yaml(path.read_bytes()) or {}
+    _remember_yaml(path, config)
+    return config
+
+
+def _dump_yaml(config: dict, path: Path) -> None:
+    """
+    Write `config` to `path` as YAML and record it in the YAML cache.
+
+    The YAML is written to a temporary sibling file that then replaces `path`, so an
+    interrupted write never leaves a truncated config behind. A symlinked `path` is
+    followed (the link itself is kept) and the existing file's permissions carry over.
+    """
+    data = _emit_yaml(config)
+    target = path.resolve()
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _remember_yaml(path, config)
+
+
+@cache
+def _get_griffe():
+    """Import griffe on first use and reuse it, returning None if it isn't installed."""
+    try:
+        import griffe
+    except ImportError:
+        return None
+    return griffe
 
-import yaml
+
+@cache
+def _package_path() -> Path:
+    """Return the installed great_docs package directory, resolved once per process."""
+    package_path = Path(__file__).resolve().parent
+    if (package_path / "assets").is_dir():
+        return package_path
+
+    # Not a plain directory install (e.g., zipped); let importlib.resources locate it
+    from importlib import resources
+
+    return Path(resources.files("great_docs"))
+
+
+# Static format.html settings that great-docs adds when the user hasn't set them (in
+# the order they are written to a new _quarto.yml)
+_QUARTO_HTML_DEFAULTS: dict = {
+    # The flatly theme works well with great-docs
+    "theme": "flatly",
+    # Table of contents configuration for API reference navigation
+    "toc": True,
+    "toc-depth": 2,
+    "toc-title": "On this page",
+    "shift-heading-level-by": -1,
+}
+
+# Sidebar navigation for reference pages, added when the site doesn't define a sidebar
+_QUARTO_SIDEBAR_DEFAULT = [{"id": "reference", "contents": "reference/"}]
+
+
+def _merge_missing(target: dict, defaults: dict) -> None:
+    """
+    Recursively copy entries from `defaults` into `target` where `target` lacks them.
+
+    Existing values are never overwritten; nested mappings present on both sides are
+    merged in turn.
+    """
+    for key, value in defaults.items():
+        if key not in target:
+            target[key] = copy.deepcopy(value)
+        elif isinstance(value, dict) and isinstance(target[key], dict):
+            _merge_missing(target[key], value)
+
+
+def _is_yes(response: str, default: bool) -> bool:
+    """
+    Interpret an answer to a yes/no prompt from its first character.
+
+    "y", "Y", "yes", etc. are yes and anything starting with "n" is no; an empty answer
+    gives `default`. For a `[y/N]` prompt (default False), any other answer is no, and
+    for a `[Y/n]` prompt (default True) it is yes.
+    """
+    first = response.strip()[:1].lower()
+    if not first:
+        return default
+    if default:
+        return first != "n"
+    return first == "y"
+
+
+def _list_file_names(directory: Path) -> set[str]:
+    """Return the names of the regular files in `directory` (empty if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _run_with_output_tail(
+    args: list[str],
+    cwd: Path | None = None,
+    max_lines: int = 200,
+    progress_message: str | None = None,
+) -> tuple[int, str]:
+    """
+    Run a command, keeping only the last `max_lines` lines of its combined output.
+
+    The output is consumed line by line while the command runs, so memory use stays
+    bounded however much the command prints. If `progress_message` is given it is
+    printed, and on a terminal a spinner next to it advances as output arrives.
+
+    Returns
+    -------
+    tuple[int, str]
+        The command's return code and the tail of its stdout/stderr.
+    """
+    import subprocess
+    import sys
+    import time
+
+    show_spinner = progress_message is not None and sys.stdout.isatty()
+    if progress_message is not None:
+        print(f"{progress_message} ", end="", flush=True)
+
+    tail: deque[str] = deque(maxlen=max_lines)
+    with subprocess.Popen(
+        args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    ) as proc:
+        assert proc.stdout is not None
+        idx = 0
+        last_tick = 0.0
+        for line in proc.stdout:
+            tail.append(line)
+            # Redraw at most ten times a second
+            if show_spinner and (now := time.monotonic()) - last_tick >= 0.1:
+                print(f"\r{progress_message} {_SPINNER[idx % len(_SPINNER)]}", end="", flush=True)
+                idx += 1
+                last_tick = now
+
+    if show_spinner:
+        print(f"\r{progress_message} ", end="", flush=True)
+
+    return proc.returncode, "".join(tail)
 
 
 class GreatDocs:
@@ -30,16 +340,19 @@ class GreatDocs:
         self.project_root = Path(project_path or os.getcwd())
         self.docs_dir = self._find_or_create_docs_dir(docs_dir)
         self.project_path = self.project_root / self.docs_dir
-        try:
-            # Python 3.9+
-            self.package_path = Path(resources.files("great_docs"))
-        except AttributeError:
-            # Fallback for older Python versions
-            import importlib_resources  # type: ignore[import-not-found]
-
-            self.package_path = Path(importlib_resources.files("great_docs"))
+        self.package_path = _package_path()
         self.assets_path = self.package_path / "assets"
 
+        # Package name detection result, filled in on first use
+        self._package_name: str | None = None
+        self._package_name_detected = False
+
+        # Project state that is read repeatedly within one install() or build(): griffe
+        # models of the documented package, pyproject.toml metadata, and discovered exports
+        self._griffe_packages: dict[str, Any] = {}
+        self._package_metadata: dict | None = None
+        self._package_exports: dict[str, list | None] = {}
+
     def _find_or_create_docs_dir(self, docs_dir: str | None = None) -> Path:
         """
         Find or create the documentation directory.
@@ -60,27 +373,38 @@ class GreatDocs:
         # Common documentation directory names
         common_docs_dirs = ["docs", "documentation", "site", "docsrc", "doc"]
 
+        # List the project root once so candidates can be checked by name
+        subdirs: set[str] = set()
+        has_root_quarto_yml = False
+        try:
+            with os.scandir(self.project_root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdirs.add(entry.name)
+                    elif entry.name == "_quarto.yml":
+                        has_root_quarto_yml = True
+        except FileNotFoundError:
+            pass
+        existing_docs_dirs = [name for name in common_docs_dirs if name in subdirs]
+
         # First, look for existing _quarto.yml in common locations
-        for dir_name in common_docs_dirs:
-            potential_dir = self.project_root / dir_name
-            if (potential_dir / "_quarto.yml").exists():
+        for dir_name in existing_docs_dirs:
+            if (self.project_root / dir_name / "_quarto.yml").exists():
                 print(f"Found existing Quarto project in '{dir_name}/' directory")
                 return Path(dir_name)
 
         # Check if _quarto.yml exists in project root
-        if (self.project_root / "_quarto.yml").exists():
+        if has_root_quarto_yml:
             print("Found _quarto.yml in project root")
             return Path(".")
 
         # Look for any existing common docs directories (even without _quarto.yml)
-        for dir_name in common_docs_dirs:
-            potential_dir = self.project_root / dir_name
-            if potential_dir.exists() and potential_dir.is_dir():
-                response = input(
-                    f"Found existing '{dir_name}/' directory. Install great-docs here? [Y/n]: "
-                )
-                if response.lower() != "n":
-                    return Path(dir_name)
+        for dir_name in existing_docs_dirs:
+            response = input(
+                f"Found existing '{dir_name}/' directory. Install great-docs here? [Y/n]: "
+            )
+            if _is_yes(response, default=True):
+                return Path(dir_name)
 
         # No existing docs directory found - ask user
         print("\nNo documentation directory detected.")
@@ -138,75 +462,65 @@ class GreatDocs:
         """
         print("Installing great-docs to your quartodoc project...")
 
-        # Create docs directory if it doesn't exist
-        self.project_path.mkdir(parents=True, exist_ok=True)
-        print(f"Using directory: {self.project_path.relative_to(self.project_root)}")
+        # Re-read the project's metadata and API on every install
+        self._reset_run_caches()
 
-        # Create necessary directories
+        # Create the docs directory (if needed) along with its scripts directory
         scripts_dir = self.project_path / "scripts"
-        scripts_dir.mkdir(exist_ok=True)
+        scripts_dir.mkdir(parents=True, exist_ok=True)
+        print(f"Using directory: {self.docs_dir}")
 
-        # Copy post-render script
-        post_render_src = self.assets_path / "post-render.py"
-        post_render_dst = scripts_dir / "post-render.py"
-
-        if post_render_dst.exists() and not force:
-            response = input(f"{post_render_dst} already exists. Overwrite? [y/N]: ")
-            if response.lower() != "y":
-                print("Skipping post-render.py")
-            else:
-                shutil.copy2(post_render_src, post_render_dst)
-                print(f"Copied {post_render_dst}")
-        else:
-            shutil.copy2(post_render_src, post_render_dst)
-            print(f"Copied {post_render_dst}")
-
-        # Copy CSS file
-        css_src = self.assets_path / "styles.css"
-        css_dst = self.project_path / "great-docs.css"
+        # List the destination directories once rather than checking each file
+        existing = {
+            directory: _list_file_names(directory) for directory in (self.project_path, scripts_dir)
+        }
 
-        if css_dst.exists() and not force:
-            response = input(f"{css_dst} already exists. Overwrite? [y/N]: ")
-            if response.lower() != "y":
-                print("Skipping great-docs.css")
-            else:
-                shutil.copy2(css_src, css_dst)
-                print(f"Copied {css_dst}")
-        else:
-            shutil.copy2(css_src, css_dst)
-            print(f"Copied {css_dst}")
+        # Copy the post-render script and CSS file
+        asset_plan = [
+            ("post-render.py", self.project_path / _POST_RENDER_SCRIPT),
+            ("styles.css", self.project_path / _GREAT_DOCS_CSS),
+        ]
+        for asset_name, dst in asset_plan:
+            self._copy_asset(
+                self.assets_path / asset_name,
+                dst,
+                force=force,
+                exists=dst.name in existing[dst.parent],
+            )
 
         # Copy .gitignore file
         gitignore_src = self.assets_path / ".gitignore"
         gitignore_dst = self.project_path / ".gitignore"
 
-        if gitignore_dst.exists() and not force:
-            # Append to existing .gitignore if it doesn't already contain our entries
+        gitignore_exists = ".gitignore" in existing[self.project_path]
+
+        if gitignore_exists and not force:
+            # Append to existing .gitignore if it doesn't already contain our entries;
+            # scan line by line so we stop at the first match
             with open(gitignore_dst, "r") as f:
-                existing_content = f.read()
+                has_site_entry = any("_site/" in line for line in f)
 
-            if "_site/" not in existing_content:
-                with open(gitignore_src, "r") as f:
-                    new_content = f.read()
-                with open(gitignore_dst, "a") as f:
-                    f.write("\n" + new_content)
+            if not has_site_entry:
+                with open(gitignore_src, "r") as src, open(gitignore_dst, "a") as dst:
+                    dst.write("\n")
+                    shutil.copyfileobj(src, dst)
                 print(f"Appended to {gitignore_dst}")
             else:
                 print("Skipping .gitignore (already contains _site/ entry)")
         else:
-            shutil.copy2(gitignore_src, gitignore_dst)
-            print(f"Copied {gitignore_dst}")
-
-        # Update _quarto.yml configuration
-        self._update_quarto_config()
+            self._copy_asset(gitignore_src, gitignore_dst, force=True, exists=gitignore_exists)
 
         # Create index.qmd from README.md if it doesn't exist
         self._create_index_from_readme()
 
-        # Add quartodoc configuration if not present
-        if not skip_quartodoc:
-            self._add_quartodoc_config()
-            self._update_sidebar_from_sections()
+        # Update _quarto.yml with the great-docs settings and, unless skipped, the
+        # quartodoc configuration and its sidebar, reading and writing the file once
+        if skip_quartodoc:
+            self._update_quarto_config()
+        else:
+            self._update_quarto_config(
+                self._apply_quartodoc_config, self._apply_sidebar_from_sections
+            )
             self._update_reference_index_frontmatter()
 
         print("\nGreat Docs installation complete!")
@@ -224,47 +538,107 @@ class GreatDocs:
             print("\nNext steps:")
             print("1. Run `quarto render` to build your site")
 
+    def _copy_asset(
+        self, src: Path, dst: Path, force: bool = False, exists: bool | None = None
+    ) -> None:
+        """
+        Copy a bundled asset into the project.
+
+        Destinations that already match the source are left untouched, so re-running
+        `install()` doesn't rewrite (or prompt about) files that are up to date.
+
+        Parameters
+        ----------
+        src
+            Path to the asset in the great-docs package.
+        dst
+            Destination path in the project.
+        force
+            If True, overwrite a differing destination without prompting.
+        exists
+            Whether `dst` is already present, if the caller knows. Checked on disk when
+            None.
+        """
+        if exists is None:
+            exists = dst.exists()
+
+        if exists:
+            # Matching size and mtime (copy2() below preserves the mtime) settle it
+            # without reading either file; otherwise the contents are compared
+            if filecmp.cmp(src, dst):
+                print(f"{dst} is up to date")
+                return
+
+            if not force:
+                response = input(f"{dst} already exists. Overwrite? [y/N]: ")
+                if not _is_yes(response, default=False):
+                    print(f"Skipping {dst.name}")
+                    return
+
+        # Keep the source's mtime so the next install's comparison is a stat; copy2()
+        # still copies the data in-kernel where possible (e.g., sendfile on Linux)
+        shutil.copy2(src, dst)
+        print(f"Copied {dst}")
+
     def _detect_package_name(self) -> str | None:
         """
         Detect the Python package name from project structure.
 
+        The result is computed once and reused until the next install() or build().
+
         Returns
         -------
         str | None
             The detected package name, or None if not found.
         """
-        # Look for pyproject.toml
-        pyproject_path = self.project_root / "pyproject.toml"
-        if pyproject_path.exists():
-            import tomllib
+        if not self._package_name_detected:
+            self._package_name = self._read_package_name()
+            self._package_name_detected = True
+        return self._package_name
 
-            with open(pyproject_path, "rb") as f:
-                try:
-                    data = tomllib.load(f)
-                    return data.get("project", {}).get("name")
-                except Exception:
-                    return None
+    def _read_package_name(self) -> str | None:
+        """
+        Read the package name from pyproject.toml, setup.py, or the package directory.
+
+        Returns
+        -------
+        str | None
+            The package name, or None if not found.
+        """
+        # List the project root once for all three probes
+        file_names: set[str] = set()
+        subdirs: list[os.DirEntry] = []
+        with os.scandir(self.project_root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Hidden directories are never the package
+                    if not entry.name.startswith("."):
+                        subdirs.append(entry)
+                else:
+                    file_names.add(entry.name)
+
+        # Look for pyproject.toml
+        if "pyproject.toml" in file_names:
+            return _pyproject_name((self.project_root / "pyproject.toml").read_bytes())
 
         # Look for setup.py
-        setup_py = self.project_root / "setup.py"
-        if setup_py.exists():
-            with open(setup_py, "r") as f:
-                content = f.read()
-                # Simple regex to find name="..." in setup()
-                import re
-
-                match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1)
-
-        # Look for a single Python package directory
-        potential_packages = [
-            d
-            for d in self.project_root.iterdir()
-            if d.is_dir() and (d / "__init__.py").exists() and not d.name.startswith(".")
-        ]
-        if len(potential_packages) == 1:
-            return potential_packages[0].name
+        if "setup.py" in file_names:
+            content = (self.project_root / "setup.py").read_text(encoding="utf-8")
+            # Simple regex to find name="..." in setup()
+            match = _SETUP_NAME_RE.search(content)
+            if match:
+                return match.group(1)
+
+        # Look for a single Python package directory; stop as soon as a second one
+        # shows up since the name is then ambiguous
+        potential_packages = []
+        for entry in subdirs:
+            if os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                potential_packages.append(entry.name)
+                if len(potential_packages) > 1:
+                    return None
+        if potential_packages:
+            return potential_packages[0]
 
         return None
 
@@ -315,10 +689,34 @@ class GreatDocs:
         # Fallback to project_root if we can't find it
         return self.project_root
 
+    def _reset_run_caches(self) -> None:
+        """Forget project state cached during a previous install() or build()."""
+        self._package_name = None
+        self._package_name_detected = False
+        self._griffe_packages.clear()
+        self._package_metadata = None
+        self._package_exports.clear()
+
     def _get_package_metadata(self) -> dict:
         """
         Extract package metadata from pyproject.toml for sidebar.
 
+        The metadata is read once and reused until the next install() or build(), since
+        it's consulted many times while generating the site.
+
+        Returns
+        -------
+        dict
+            Dictionary containing package metadata like license, authors, URLs, etc.
+        """
+        if self._package_metadata is None:
+            self._package_metadata = self._read_package_metadata()
+        return self._package_metadata
+
+    def _read_package_metadata(self) -> dict:
+        """
+        Read package metadata from pyproject.toml.
+
         Returns
         -------
         dict
@@ -331,8 +729,6 @@ class GreatDocs:
         if not pyproject_path.exists():
             return metadata
 
-        import tomllib
-
         try:
             with open(pyproject_path, "rb") as f:
                 data = tomllib.load(f)
@@ -400,17 +796,48 @@ class GreatDocs:
         # - https://github.com/owner/repo
         # - https://github.com/owner/repo.git
         # - git@github.com:owner/repo.git
-        github_pattern = r"github\.com[/:]([^/]+)/([^/\s.]+)"
-        match = re.search(github_pattern, repo_url)
+        match = _GITHUB_REPO_RE.search(repo_url)
 
         if match:
             owner = match.group(1)
-            repo = match.group(2).rstrip(".git")
+            repo = match.group(2)
             base_url = f"https://github.com/{owner}/{repo}"
             return owner, repo, base_url
 
         return None, None, None
 
+    def _load_griffe_package(self, package_name: str) -> Any:
+        """
+        Load a package with griffe, reusing a model loaded earlier in the same run.
+
+        Source links, quartodoc sections, and directives all work from the package
+        model, and source links need it for every export and method. Loading it once
+        avoids re-parsing the whole package each time.
+
+        Parameters
+        ----------
+        package_name
+            The importable name of the package.
+
+        Returns
+        -------
+        griffe.Module
+            The loaded package.
+
+        Raises
+        ------
+        ImportError
+            If griffe isn't installed.
+        """
+        pkg = self._griffe_packages.get(package_name)
+        if pkg is None:
+            griffe = _get_griffe()
+            if griffe is None:
+                raise ImportError("griffe is required to load the package")
+
+            pkg = self._griffe_packages[package_name] = griffe.load(package_name)
+        return pkg
+
     def _get_source_location(self, package_name: str, item_name: str) -> dict | None:
         """
         Get source file and line numbers for a class, method, or function.
@@ -420,7 +847,7 @@ class GreatDocs:
         Parameters
         ----------
         package_name
-            The name of the package containing the item.
+            The importable name of the package containing the item.
         item_name
             The fully qualified name of the item (e.g., "ClassName" or "ClassName.method_name").
 
@@ -430,13 +857,9 @@ class GreatDocs:
             Dictionary with file path and line numbers, or None if not found.
         """
         try:
-            import griffe
-
-            normalized_name = package_name.replace("-", "_")
-
             # Load the package with griffe
             try:
-                pkg = griffe.load(normalized_name)
+                pkg = self._load_griffe_package(package_name)
             except Exception:
                 return None
 
@@ -615,10 +1038,10 @@ class GreatDocs:
         print(f"Generating source links for {package_name}...")
 
         source_links: dict[str, dict] = {}
-        normalized_name = package_name.replace("-", "_")
+        normalized_name = self._normalize_package_name(package_name)
 
         # Get all exports
-        exports = self._get_package_exports(package_name)
+        exports = self._get_package_exports(normalized_name)
         if not exports:
             return
 
@@ -626,6 +1049,11 @@ class GreatDocs:
         branch = self._detect_git_ref()
         print(f"Using git ref: {branch}")
 
+        # Categorize all exports at once to learn which classes need method links
+        class_method_names = self._categorize_api_objects(normalized_name, exports).get(
+            "class_method_names", {}
+        )
+
         # Generate source links for each export
         for item_name in exports:
             source_loc = self._get_source_location(normalized_name, item_name)
@@ -640,21 +1068,18 @@ class GreatDocs:
                     }
 
             # Also get source links for methods of classes
-            categories = self._categorize_api_objects(package_name, [item_name])
-            if item_name in categories.get("classes", []):
-                method_names = categories.get("class_method_names", {}).get(item_name, [])
-                for method_name in method_names:
-                    full_name = f"{item_name}.{method_name}"
-                    method_loc = self._get_source_location(normalized_name, full_name)
-                    if method_loc:
-                        method_url = self._build_github_source_url(method_loc, branch)
-                        if method_url:
-                            source_links[full_name] = {
-                                "url": method_url,
-                                "file": method_loc.get("file", ""),
-                                "start_line": method_loc.get("start_line", 0),
-                                "end_line": method_loc.get("end_line", 0),
-                            }
+            for method_name in class_method_names.get(item_name, []):
+                full_name = f"{item_name}.{method_name}"
+                method_loc = self._get_source_location(normalized_name, full_name)
+                if method_loc:
+                    method_url = self._build_github_source_url(method_loc, branch)
+                    if method_url:
+                        source_links[full_name] = {
+                            "url": method_url,
+                            "file": method_loc.get("file", ""),
+                            "start_line": method_loc.get("start_line", 0),
+                            "end_line": method_loc.get("end_line", 0),
+                        }
 
         # Write to JSON file in the docs directory
         source_links_path = self.project_path / "_source_links.json"
@@ -680,36 +1105,55 @@ class GreatDocs:
         Path | None
             Path to the __init__.py file, or None if not found.
         """
+        found = self._read_package_init(package_name)
+        return found[0] if found else None
+
+    def _read_package_init(self, package_name: str) -> tuple[Path, bytes] | None:
+        """
+        Find and read the __init__.py file for a package.
+
+        The candidate has to be read to confirm it's the package's main __init__.py, so
+        its contents are returned along with the path rather than read again later.
+
+        Parameters
+        ----------
+        package_name
+            The name of the package to find.
+
+        Returns
+        -------
+        tuple[Path, bytes] | None
+            The path to the __init__.py file and its raw contents, or None if not found.
+        """
         # Normalize package name (replace dashes with underscores)
         normalized_name = package_name.replace("-", "_")
 
+        # Only probe both spellings when they actually differ
+        names = (
+            (normalized_name,)
+            if package_name == normalized_name
+            else (package_name, normalized_name)
+        )
+
         # Common locations to search for package directories
         search_paths = [
-            self.project_root / package_name,
-            self.project_root / normalized_name,
-            self.project_root / "python" / package_name,
-            self.project_root / "python" / normalized_name,
-            self.project_root / "src" / package_name,
-            self.project_root / "src" / normalized_name,
-            self.project_root / "lib" / package_name,
-            self.project_root / "lib" / normalized_name,
+            self.project_root / subdir / name
+            for subdir in ("", "python", "src", "lib")
+            for name in names
         ]
 
         for package_dir in search_paths:
-            if not package_dir.exists() or not package_dir.is_dir():
+            # Opening the file directly covers the directory and file existence checks
+            init_file = package_dir / "__init__.py"
+            try:
+                content = init_file.read_bytes()
+            except OSError:
                 continue
 
-            init_file = package_dir / "__init__.py"
-            if init_file.exists():
-                # Verify this is likely the right __init__.py by checking for __version__
-                try:
-                    with open(init_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        # Check if it has __version__ (good indicator of main package __init__)
-                        if "__version__" in content or "__all__" in content:
-                            return init_file
-                except Exception:
-                    continue
+            # Verify this is likely the right __init__.py by checking for __version__
+            # (good indicator of main package __init__) or __all__
+            if b"__version__" in content or b"__all__" in content:
+                return init_file, content
 
         return None
 
@@ -731,10 +1175,11 @@ class GreatDocs:
             List of public names from __all__ (filtered by exclusions), or None if not found.
         """
         # Find the package's __init__.py file
-        init_file = self._find_package_init(package_name)
-        if not init_file:
+        found = self._read_package_init(package_name)
+        if not found:
             print(f"Could not locate __init__.py for package '{package_name}'")
             return None
+        init_file, content = found
 
         print(f"Found package __init__.py at: {init_file.relative_to(self.project_root)}")
 
@@ -743,34 +1188,13 @@ class GreatDocs:
         config_exclude = metadata.get("exclude", [])
 
         try:
-            with open(init_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Try to extract __all__ and __gt_exclude__ using AST (safer than eval)
-            import ast
-
-            tree = ast.parse(content)
-
-            all_exports = None
-            gt_exclude = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        # Extract __all__
-                        if isinstance(target, ast.Name) and target.id == "__all__":
-                            if isinstance(node.value, ast.List):
-                                all_exports = []
-                                for elt in node.value.elts:
-                                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                                        all_exports.append(elt.value)
-
-                        # Extract __gt_exclude__ (legacy support)
-                        if isinstance(target, ast.Name) and target.id == "__gt_exclude__":
-                            if isinstance(node.value, ast.List):
-                                for elt in node.value.elts:
-                                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                                        gt_exclude.append(elt.value)
+            # Most packages define both as a plain list literal, which can be read
+            # without parsing the whole (often docstring-heavy) module
+            all_exports = _scan_string_list(content, "__all__")
+            gt_exclude = _scan_string_list(content, "__gt_exclude__")
+
+            if all_exports is None or gt_exclude is None:
+                all_exports, gt_exclude = self._parse_export_lists(content)
 
             if all_exports:
                 print(f"Successfully parsed __all__ with {len(all_exports)} exports")
@@ -801,6 +1225,72 @@ class GreatDocs:
             print(f"Error parsing __all__: {type(e).__name__}: {e}")
             return None
 
+    def _parse_export_lists(self, source: bytes) -> tuple[list | None, list]:
+        """
+        Extract `__all__` and `__gt_exclude__` from module source with a full AST parse.
+
+        Only module-level statements are visited (including those nested in `if` and
+        `try` blocks), since assignments inside functions or classes don't define the
+        module's exports. List and tuple values are both accepted, and later `+=`
+        extensions are applied.
+
+        Parameters
+        ----------
+        source
+            The raw bytes of the module (`ast.parse()` honors any encoding declaration).
+
+        Returns
+        -------
+        tuple[list | None, list]
+            The names in `__all__` (None if it isn't assigned a list or tuple) and the
+            names in `__gt_exclude__`.
+        """
+        import ast
+
+        def string_items(value: ast.expr | None) -> list[str] | None:
+            if not isinstance(value, (ast.List, ast.Tuple)):
+                return None
+            return [
+                elt.value
+                for elt in value.elts
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            ]
+
+        def module_level(statements: list[ast.stmt]):
+            for node in statements:
+                yield node
+                if isinstance(node, ast.If):
+                    yield from module_level(node.body)
+                    yield from module_level(node.orelse)
+                elif isinstance(node, ast.Try):
+                    yield from module_level(node.body)
+                    for handler in node.handlers:
+                        yield from module_level(handler.body)
+                    yield from module_level(node.orelse)
+                    yield from module_level(node.finalbody)
+
+        found: dict[str, list[str] | None] = {"__all__": None, "__gt_exclude__": None}
+
+        for node in module_level(ast.parse(source).body):
+            if isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                items = string_items(node.value)
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in found and items is not None:
+                        found[target.id] = list(items)
+            elif (
+                isinstance(node, ast.AugAssign)
+                and isinstance(node.op, ast.Add)
+                and isinstance(node.target, ast.Name)
+                and node.target.id in found
+            ):
+                items = string_items(node.value)
+                current = found[node.target.id]
+                if items is not None and current is not None:
+                    current.extend(items)
+
+        return found["__all__"], found["__gt_exclude__"] or []
+
     # Auto-excluded names that are typically not meant for documentation
     # These are common internal/utility exports that most packages don't want documented
     AUTO_EXCLUDE = {
@@ -843,22 +1333,22 @@ class GreatDocs:
         Parameters
         ----------
         package_name
-            The name of the package to discover exports from.
+            The importable name of the package to discover exports from.
 
         Returns
         -------
         list | None
             List of public names discovered (filtered by exclusions), or `None` if discovery failed.
         """
-        try:
-            import griffe
-
-            # Normalize package name (replace dashes with underscores)
-            normalized_name = package_name.replace("-", "_")
+        griffe = _get_griffe()
+        if griffe is None:
+            print("Warning: griffe not available, cannot use dir() discovery")
+            return None
 
+        try:
             # Load the package using griffe
             try:
-                pkg = griffe.load(normalized_name)
+                pkg = self._load_griffe_package(package_name)
             except Exception as e:
                 print(f"Warning: Could not load package with griffe ({type(e).__name__})")
                 return None
@@ -946,7 +1436,7 @@ class GreatDocs:
             try:
                 import importlib
 
-                actual_package = importlib.import_module(normalized_name)
+                actual_package = importlib.import_module(package_name)
             except ImportError:
                 pass
 
@@ -965,7 +1455,7 @@ class GreatDocs:
                 if quartodoc_get_object is not None:
                     try:
                         # Try to load the object exactly as quartodoc would
-                        qd_obj = quartodoc_get_object(f"{normalized_name}:{name}")
+                        qd_obj = quartodoc_get_object(f"{package_name}:{name}")
                         # Try to access members to trigger any lazy resolution errors
                         _ = qd_obj.members
                         _ = qd_obj.kind
@@ -1004,9 +1494,6 @@ class GreatDocs:
 
             return safe_exports
 
-        except ImportError:
-            print("Warning: griffe not available, cannot use dir() discovery")
-            return None
         except Exception as e:
             print(f"Error discovering exports via dir(): {type(e).__name__}: {e}")
             return None
@@ -1018,6 +1505,27 @@ class GreatDocs:
         By default, uses dir() to discover public objects. If `discovery_method`
         is set to "all" in [tool.great-docs], uses __all__ instead.
 
+        Parameters
+        ----------
+        package_name
+            The name of the package to get exports from.
+
+        Returns
+        -------
+        list | None
+            List of exported/public names, or None if discovery failed.
+        """
+        # Source links and quartodoc sections both need the exports during a build
+        if package_name not in self._package_exports:
+            self._package_exports[package_name] = self._find_package_exports(package_name)
+
+        exports = self._package_exports[package_name]
+        return list(exports) if exports is not None else None
+
+    def _find_package_exports(self, package_name: str) -> list | None:
+        """
+        Discover package exports with the configured discovery method.
+
         Parameters
         ----------
         package_name
@@ -1053,7 +1561,7 @@ class GreatDocs:
         Parameters
         ----------
         package_name
-            The name of the package.
+            The importable name of the package.
         exports
             List of exported names from __all__.
 
@@ -1067,174 +1575,169 @@ class GreatDocs:
             - class_methods: dict mapping class name to method count
             - class_method_names: dict mapping class name to list of method names
         """
-        try:
-            import griffe
-
-            # Load the package using griffe
-            normalized_name = package_name.replace("-", "_")
-
-            # Try to use quartodoc's get_object for validation
-            quartodoc_get_object = None
-            try:
-                from functools import partial
+        griffe = _get_griffe()
+        if griffe is None:
+            print("Warning: griffe not available, using fallback categorization")
+            # Fallback if griffe isn't installed
+            skip_names = {"__version__", "__author__", "__email__", "__all__"}
+            filtered_exports = [e for e in exports if e not in skip_names]
+            return {
+                "classes": [],
+                "functions": [],
+                "other": filtered_exports,
+                "class_methods": {},
+                "class_method_names": {},
+            }
 
-                from quartodoc import get_object as qd_get_object
+        # Try to use quartodoc's get_object for validation
+        quartodoc_get_object = None
+        try:
+            from functools import partial
 
-                quartodoc_get_object = partial(qd_get_object, dynamic=True, parser="numpy")
-            except ImportError:
-                pass
+            from quartodoc import get_object as qd_get_object
 
-            # Try to load the package with griffe
-            try:
-                pkg = griffe.load(normalized_name)
-            except Exception as e:
-                print(f"Warning: Could not load package with griffe ({type(e).__name__})")
-                # Fallback to simple categorization
-                skip_names = {"__version__", "__author__", "__email__", "__all__"}
-                filtered_exports = [e for e in exports if e not in skip_names]
-                return {
-                    "classes": [],
-                    "functions": [],
-                    "other": filtered_exports,
-                    "class_methods": {},
-                    "class_method_names": {},
-                }
+            quartodoc_get_object = partial(qd_get_object, dynamic=True, parser="numpy")
+        except ImportError:
+            pass
 
-            categories = {
+        # Try to load the package with griffe
+        try:
+            pkg = self._load_griffe_package(package_name)
+        except Exception as e:
+            print(f"Warning: Could not load package with griffe ({type(e).__name__})")
+            # Fallback to simple categorization
+            skip_names = {"__version__", "__author__", "__email__", "__all__"}
+            filtered_exports = [e for e in exports if e not in skip_names]
+            return {
                 "classes": [],
                 "functions": [],
-                "other": [],
+                "other": filtered_exports,
                 "class_methods": {},
                 "class_method_names": {},
             }
-            failed_introspection = []
-            cyclic_aliases = []
 
-            # Skip common metadata variables
-            skip_names = {"__version__", "__author__", "__email__", "__all__"}
+        categories = {
+            "classes": [],
+            "functions": [],
+            "other": [],
+            "class_methods": {},
+            "class_method_names": {},
+        }
+        failed_introspection = []
+        cyclic_aliases = []
 
-            for name in exports:
-                # Skip metadata variables
-                if name in skip_names:
-                    continue
+        # Skip common metadata variables
+        skip_names = {"__version__", "__author__", "__email__", "__all__"}
 
-                try:
-                    # Get the object from the loaded package
-                    if name not in pkg.members:
-                        categories["other"].append(name)
-                        failed_introspection.append(name)
-                        continue
+        for name in exports:
+            # Skip metadata variables
+            if name in skip_names:
+                continue
 
-                    obj = pkg.members[name]
+            try:
+                # Get the object from the loaded package
+                if name not in pkg.members:
+                    categories["other"].append(name)
+                    failed_introspection.append(name)
+                    continue
 
-                    # Categorize based on griffe's kind
-                    # Note: Accessing obj.kind or obj.members on an Alias can trigger
-                    # resolution which may raise CyclicAliasError or AliasResolutionError
-                    if obj.kind.value == "class":
-                        categories["classes"].append(name)
-                        # Get public methods (exclude private/magic methods)
-                        # We need to handle each member individually to catch cyclic aliases
-                        # AND validate each method with quartodoc to catch type hint issues
-                        # Collect (method_name, lineno) tuples to preserve source order
-                        method_entries = []
-                        skipped_methods = []
-                        try:
-                            for member_name, member in obj.members.items():
-                                if member_name.startswith("_"):
-                                    continue
-                                try:
-                                    # Accessing member.kind can trigger alias resolution
-                                    if member.kind.value in ("function", "method"):
-                                        # Get line number for source ordering
-                                        lineno = getattr(member, "lineno", float("inf"))
-                                        # Validate with quartodoc if available
-                                        if quartodoc_get_object is not None:
-                                            try:
-                                                qd_obj = quartodoc_get_object(
-                                                    f"{normalized_name}:{name}.{member_name}"
-                                                )
-                                                # Try to access properties that might fail
-                                                _ = qd_obj.members
-                                                _ = qd_obj.kind
-                                                method_entries.append((member_name, lineno))
-                                            except Exception:
-                                                # Method can't be documented by quartodoc
-                                                skipped_methods.append(member_name)
-                                        else:
+                obj = pkg.members[name]
+
+                # Categorize based on griffe's kind
+                # Note: Accessing obj.kind or obj.members on an Alias can trigger
+                # resolution which may raise CyclicAliasError or AliasResolutionError
+                if obj.kind.value == "class":
+                    categories["classes"].append(name)
+                    # Get public methods (exclude private/magic methods)
+                    # We need to handle each member individually to catch cyclic aliases
+                    # AND validate each method with quartodoc to catch type hint issues
+                    # Collect (method_name, lineno) tuples to preserve source order
+                    method_entries = []
+                    skipped_methods = []
+                    try:
+                        for member_name, member in obj.members.items():
+                            if member_name.startswith("_"):
+                                continue
+                            try:
+                                # Accessing member.kind can trigger alias resolution
+                                if member.kind.value in _METHOD_KINDS:
+                                    # Get line number for source ordering
+                                    lineno = getattr(member, "lineno", float("inf"))
+                                    # Validate with quartodoc if available
+                                    if quartodoc_get_object is not None:
+                                        try:
+                                            qd_obj = quartodoc_get_object(
+                                                f"{package_name}:{name}.{member_name}"
+                                            )
+                                            # Try to access properties that might fail
+                                            _ = qd_obj.members
+                                            _ = qd_obj.kind
                                             method_entries.append((member_name, lineno))
-                                except (
-                                    griffe.CyclicAliasError,
-                                    griffe.AliasResolutionError,
-                                ):
-                                    # Skip cyclic/unresolvable class members
-                                    skipped_methods.append(member_name)
-                                except Exception:
-                                    # Skip members that can't be introspected
-                                    pass
-                        except (griffe.CyclicAliasError, griffe.AliasResolutionError):
-                            # If we can't even iterate members, class has issues
-                            skipped_methods.append("<members>")
-
-                        # Sort by line number to preserve source file order
-                        method_entries.sort(key=lambda x: x[1])
-                        method_names = [entry[0] for entry in method_entries]
-
-                        if skipped_methods:
-                            print(
-                                f"  {name}: class with {len(method_names)} public methods "
-                                f"(skipped {len(skipped_methods)} undocumentable method(s): "
-                                f"{', '.join(skipped_methods[:3])}{'...' if len(skipped_methods) > 3 else ''})"
-                            )
-                        else:
-                            print(f"  {name}: class with {len(method_names)} public methods")
-
-                        categories["class_methods"][name] = len(method_names)
-                        categories["class_method_names"][name] = method_names
-                    elif obj.kind.value == "function":
-                        categories["functions"].append(name)
+                                        except Exception:
+                                            # Method can't be documented by quartodoc
+                                            skipped_methods.append(member_name)
+                                    else:
+                                        method_entries.append((member_name, lineno))
+                            except (
+                                griffe.CyclicAliasError,
+                                griffe.AliasResolutionError,
+                            ):
+                                # Skip cyclic/unresolvable class members
+                                skipped_methods.append(member_name)
+                            except Exception:
+                                # Skip members that can't be introspected
+                                pass
+                    except (griffe.CyclicAliasError, griffe.AliasResolutionError):
+                        # If we can't even iterate members, class has issues
+                        skipped_methods.append("<members>")
+
+                    # Sort by line number to preserve source file order
+                    method_entries.sort(key=lambda x: x[1])
+                    method_names = [entry[0] for entry in method_entries]
+
+                    if skipped_methods:
+                        print(
+                            f"  {name}: class with {len(method_names)} public methods "
+                            f"(skipped {len(skipped_methods)} undocumentable method(s): "
+                            f"{', '.join(skipped_methods[:3])}{'...' if len(skipped_methods) > 3 else ''})"
+                        )
                     else:
-                        # Attributes, modules, etc.
-                        categories["other"].append(name)
-
-                except griffe.CyclicAliasError:
-                    # Cyclic alias detected (e.g., re-exported symbol pointing to itself)
-                    # This can happen with complex re-export patterns
-                    # Do NOT add to categories (these must be excluded entirely)
-                    print(f"  Warning: Cyclic alias detected for '{name}', excluding from docs")
-                    cyclic_aliases.append(name)
-                except griffe.AliasResolutionError:
-                    # Alias could not be resolved (target not found)
-                    # Do NOT add to categories (these must be excluded entirely)
-                    print(f"  Warning: Could not resolve alias for '{name}', excluding from docs")
-                    failed_introspection.append(name)
-                except Exception as e:
-                    # If introspection fails for a specific object, still include it
-                    print(f"  Warning: Could not introspect '{name}': {type(e).__name__}")
+                        print(f"  {name}: class with {len(method_names)} public methods")
+
+                    categories["class_methods"][name] = len(method_names)
+                    categories["class_method_names"][name] = method_names
+                elif obj.kind.value == "function":
+                    categories["functions"].append(name)
+                else:
+                    # Attributes, modules, etc.
                     categories["other"].append(name)
-                    failed_introspection.append(name)
 
-            if cyclic_aliases:
-                print(f"Note: Excluded {len(cyclic_aliases)} cyclic alias(es) from documentation")
+            except griffe.CyclicAliasError:
+                # Cyclic alias detected (e.g., re-exported symbol pointing to itself)
+                # This can happen with complex re-export patterns
+                # Do NOT add to categories (these must be excluded entirely)
+                print(f"  Warning: Cyclic alias detected for '{name}', excluding from docs")
+                cyclic_aliases.append(name)
+            except griffe.AliasResolutionError:
+                # Alias could not be resolved (target not found)
+                # Do NOT add to categories (these must be excluded entirely)
+                print(f"  Warning: Could not resolve alias for '{name}', excluding from docs")
+                failed_introspection.append(name)
+            except Exception as e:
+                # If introspection fails for a specific object, still include it
+                print(f"  Warning: Could not introspect '{name}': {type(e).__name__}")
+                categories["other"].append(name)
+                failed_introspection.append(name)
 
-            if failed_introspection:
-                print(
-                    f"Note: Could not introspect {len(failed_introspection)} item(s), categorizing as 'Other'"
-                )
+        if cyclic_aliases:
+            print(f"Note: Excluded {len(cyclic_aliases)} cyclic alias(es) from documentation")
 
-            return categories
+        if failed_introspection:
+            print(
+                f"Note: Could not introspect {len(failed_introspection)} item(s), categorizing as 'Other'"
+            )
 
-        except ImportError:
-            print("Warning: griffe not available, using fallback categorization")
-            # Fallback if griffe isn't installed
-            skip_names = {"__version__", "__author__", "__email__", "__all__"}
-            filtered_exports = [e for e in exports if e not in skip_names]
-            return {
-                "classes": [],
-                "functions": [],
-                "other": filtered_exports,
-                "class_methods": {},
-                "class_method_names": {},
-            }
+        return categories
 
     def _create_quartodoc_sections(self, package_name: str) -> list | None:
         """
@@ -1277,7 +1780,7 @@ class GreatDocs:
         # Add classes section if there are any
         if categories["classes"]:
             class_contents = []
-            classes_with_separate_methods = []
+            method_sections = []
 
             for class_name in categories["classes"]:
                 method_count = categories["class_methods"].get(class_name, 0)
@@ -1285,7 +1788,21 @@ class GreatDocs:
                 if method_count > 5:
                     # Class with many methods: add with members: [] to suppress inline docs
                     class_contents.append({"name": class_name, "members": []})
-                    classes_with_separate_methods.append(class_name)
+
+                    # Create a separate section with fully qualified method references
+                    method_names = categories["class_method_names"].get(class_name, [])
+                    method_sections.append(
+                        {
+                            "title": f"{class_name} Methods",
+                            "desc": f"Methods for the {class_name} class",
+                            "contents": [f"{class_name}.{method}" for method in method_names],
+                        }
+                    )
+
+                    print(
+                        f"  Created separate section for {class_name} "
+                        f"with {len(method_names)} methods"
+                    )
                 else:
                     # Class with few methods: document inline
                     class_contents.append(class_name)
@@ -1298,23 +1815,8 @@ class GreatDocs:
                 }
             )
 
-            # Create separate sections for methods of large classes
-            for class_name in classes_with_separate_methods:
-                method_names = categories["class_method_names"].get(class_name, [])
-                method_count = len(method_names)
-
-                # Create fully qualified method references
-                method_contents = [f"{class_name}.{method}" for method in method_names]
-
-                sections.append(
-                    {
-                        "title": f"{class_name} Methods",
-                        "desc": f"Methods for the {class_name} class",
-                        "contents": method_contents,
-                    }
-                )
-
-                print(f"  Created separate section for {class_name} with {method_count} methods")
+            # Method sections for large classes follow the Classes section
+            sections.extend(method_sections)
 
         # Add functions section if there are any
         if categories["functions"]:
@@ -1344,7 +1846,7 @@ class GreatDocs:
         Parameters
         ----------
         package_name
-            The name of the package to scan.
+            The importable name of the package to scan.
 
         Returns
         -------
@@ -1355,17 +1857,17 @@ class GreatDocs:
         """
         from ._directives import extract_directives
 
-        try:
-            import griffe
-
-            normalized_name = package_name.replace("-", "_")
+        if _get_griffe() is None:
+            print("Warning: griffe not available for directive extraction")
+            return {}
 
-            try:
-                pkg = griffe.load(normalized_name)
-            except Exception as e:
-                print(f"Warning: Could not load package with griffe ({type(e).__name__})")
-                return {}
+        try:
+            pkg = self._load_griffe_package(package_name)
+        except Exception as e:
+            print(f"Warning: Could not load package with griffe ({type(e).__name__})")
+            return {}
 
+        try:
             directive_map = {}
 
             for name, obj in pkg.members.items():
@@ -1395,9 +1897,6 @@ class GreatDocs:
 
             return directive_map
 
-        except ImportError:
-            print("Warning: griffe not available for directive extraction")
-            return {}
         except Exception as e:
             print(f"Error extracting directives: {type(e).__name__}: {e}")
             return {}
@@ -1758,32 +2257,24 @@ title: "License"
             metadata = self._get_package_metadata()
 
             # Parse CITATION.cff for structured data
-            import yaml
+            citation_data = _parse_yaml(citation_path.read_bytes())
 
-            with open(citation_path, "r", encoding="utf-8") as f:
-                citation_data = yaml.safe_load(f)
+            # Roles from rich_authors, keyed by name (the first entry for a name wins)
+            author_roles: dict[str, str] = {}
+            for rich_author in metadata.get("rich_authors") or []:
+                author_roles.setdefault(rich_author.get("name"), rich_author.get("role", "Author"))
 
             # Build Authors section
-            authors_section = "## Authors\n\n"
-            if citation_data.get("authors"):
-                for author in citation_data["authors"]:
-                    given = author.get("given-names", "")
-                    family = author.get("family-names", "")
-                    full_name = f"{given} {family}".strip()
-
-                    # Get role from rich_authors if available
-                    role = "Author"
-                    if metadata.get("rich_authors"):
-                        for rich_author in metadata["rich_authors"]:
-                            if rich_author.get("name") == full_name:
-                                role = rich_author.get("role", "Author")
-                                break
-
-                    authors_section += f"{full_name}. {role}.  \n"
+            authors_lines = ["## Authors\n\n"]
+            for author in citation_data.get("authors") or []:
+                given = author.get("given-names", "")
+                family = author.get("family-names", "")
+                full_name = f"{given} {family}".strip()
+                authors_lines.append(f"{full_name}. {author_roles.get(full_name, 'Author')}.  \n")
+            authors_section = "".join(authors_lines)
 
             # Build Citation section with text and BibTeX
-            citation_section = "## Citation\n\n"
-            citation_section += "**Source:** `CITATION.cff`\n\n"
+            citation_lines = ["## Citation\n\n", "**Source:** `CITATION.cff`\n\n"]
 
             # Generate text citation
             if citation_data.get("authors"):
@@ -1800,37 +2291,35 @@ title: "License"
                 url = citation_data.get("url", "")
                 year = "2025"  # Could parse from date-released if available
 
-                citation_section += (
+                citation_lines.append(
                     f"{authors_str} ({year}). {title} Python package version {version}, {url}.\n\n"
                 )
 
             # Generate BibTeX
-            citation_section += "```bibtex\n"
-            citation_section += "@Manual{,\n"
+            citation_lines.append("```bibtex\n@Manual{,\n")
 
             if citation_data.get("title"):
-                citation_section += f"  title = {{{citation_data['title']}}},\n"
+                citation_lines.append(f"  title = {{{citation_data['title']}}},\n")
 
             if citation_data.get("authors"):
-                author_names = []
-                for author in citation_data["authors"]:
-                    given = author.get("given-names", "")
-                    family = author.get("family-names", "")
-                    full_name = f"{given} {family}".strip()
-                    author_names.append(full_name)
-                citation_section += f"  author = {{{' and '.join(author_names)}}},\n"
+                author_names = [
+                    f"{author.get('given-names', '')} {author.get('family-names', '')}".strip()
+                    for author in citation_data["authors"]
+                ]
+                citation_lines.append(f"  author = {{{' and '.join(author_names)}}},\n")
 
-            citation_section += "  year = {2025},\n"
+            citation_lines.append("  year = {2025},\n")
 
             if citation_data.get("version"):
-                citation_section += (
+                citation_lines.append(
                     f"  note = {{Python package version {citation_data['version']}}},\n"
                 )
 
             if citation_data.get("url"):
-                citation_section += f"  url = {{{citation_data['url']}}},\n"
+                citation_lines.append(f"  url = {{{citation_data['url']}}},\n")
 
-            citation_section += "}\n```\n"
+            citation_lines.append("}\n```\n")
+            citation_section = "".join(citation_lines)
 
             citation_qmd_content = f"""---
 title: "Authors and Citation"
@@ -1872,20 +2361,11 @@ title: "Authors and Citation"
             print(f"Creating index.qmd from {source_name}...")
 
         # Read source content
-        with open(source_file, "r", encoding="utf-8") as f:
-            readme_content = f.read()
+        readme_content = source_file.read_text(encoding="utf-8")
 
         # Adjust heading levels: bump all headings up by one level
         # This prevents h1 from becoming paragraphs and keeps proper hierarchy
-        # Replace headings from highest to lowest level to avoid double-replacement
-        import re
-
-        readme_content = re.sub(r"^######\s+", r"####### ", readme_content, flags=re.MULTILINE)
-        readme_content = re.sub(r"^#####\s+", r"###### ", readme_content, flags=re.MULTILINE)
-        readme_content = re.sub(r"^####\s+", r"##### ", readme_content, flags=re.MULTILINE)
-        readme_content = re.sub(r"^###\s+", r"#### ", readme_content, flags=re.MULTILINE)
-        readme_content = re.sub(r"^##\s+", r"### ", readme_content, flags=re.MULTILINE)
-        readme_content = re.sub(r"^#\s+", r"## ", readme_content, flags=re.MULTILINE)
+        readme_content = _ATX_HEADING_RE.sub(r"#\1 ", readme_content)
 
         # Get package metadata for sidebar
         metadata = self._get_package_metadata()
@@ -2166,10 +2646,18 @@ toc: false
 
         Adds sensible defaults for quartodoc with automatic package detection.
         """
-        quarto_yml = self.project_path / "_quarto.yml"
+        self._rewrite_quarto_config(self._apply_quartodoc_config)
+
+    def _apply_quartodoc_config(self, config: dict) -> None:
+        """
+        Add a quartodoc configuration to a parsed _quarto.yml if it doesn't have one.
 
-        with open(quarto_yml, "r") as f:
-            config = yaml.safe_load(f) or {}
+        Parameters
+        ----------
+        config
+            The parsed _quarto.yml, modified in place.
+        """
+        quarto_yml = self.project_path / "_quarto.yml"
 
         # Check if quartodoc config already exists
         if "quartodoc" in config:
@@ -2219,10 +2707,6 @@ toc: false
 
         config["quartodoc"] = quartodoc_config
 
-        # Write back to file
-        with open(quarto_yml, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
         print(f"Added quartodoc configuration to {quarto_yml}")
         if not sections:
             print("See: https://machow.github.io/quartodoc/get-started/overview.html")
@@ -2247,8 +2731,7 @@ toc: false
             print("Error: _quarto.yml not found. Run 'great-docs init' first.")
             return
 
-        with open(quarto_yml, "r") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(quarto_yml)
 
         if "quartodoc" not in config:
             print("Error: No quartodoc configuration found. Run 'great-docs init' first.")
@@ -2267,21 +2750,61 @@ toc: false
         sections = self._create_quartodoc_sections_from_families(package_name)
 
         if sections:
-            config["quartodoc"]["sections"] = sections
+            # Only rewrite the file if the API actually changed
+            if sections != config["quartodoc"].get("sections"):
+                config["quartodoc"]["sections"] = sections
+                _dump_yaml(config, quarto_yml)
             print(f"Updated quartodoc config with {len(sections)} section(s)")
 
-            # Also update the sidebar to match the new sections
+            # Also update the sidebar to match the new sections (now that they're on disk)
             self._update_sidebar_from_sections()
 
-            # Write back to file
-            with open(quarto_yml, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
             print(f"✅ Refreshed quartodoc configuration in {quarto_yml}")
         else:
             print("Warning: Could not discover package exports. Config unchanged.")
 
-    def _update_quarto_config(self) -> None:
+    def _rewrite_quarto_config(
+        self, *mutations: Callable[[dict], None], default: dict | None = None
+    ) -> bool:
+        """
+        Apply modifications to _quarto.yml with a single read and a single write.
+
+        Parameters
+        ----------
+        *mutations
+            Functions that modify the parsed configuration in place, applied in order.
+        default
+            Configuration to start from if _quarto.yml doesn't exist. If None, a missing
+            file is left alone.
+
+        Returns
+        -------
+        bool
+            True if the file was written, False if it is missing or the mutations left
+            the configuration unchanged.
+        """
+        quarto_yml = self.project_path / "_quarto.yml"
+
+        if quarto_yml.exists():
+            config = _load_yaml(quarto_yml)
+            original_config = copy.deepcopy(config)
+        elif default is not None:
+            config = default
+            original_config = None
+        else:
+            return False
+
+        for mutate in mutations:
+            mutate(config)
+
+        # Leave the file (and the user's formatting and comments) alone if nothing changed
+        if config == original_config:
+            return False
+
+        _dump_yaml(config, quarto_yml)
+        return True
+
+    def _update_quarto_config(self, *extra_mutations: Callable[[dict], None]) -> None:
         """
         Update _quarto.yml with great-docs configuration.
 
@@ -2290,81 +2813,79 @@ toc: false
         It preserves existing configuration while adding the necessary great-docs
         settings. If website navigation is not present, it adds a navbar with Home
         and API Reference links, and sets the site title to the package name.
+
+        Parameters
+        ----------
+        *extra_mutations
+            Further modifications to apply in the same read and write of the file.
         """
         quarto_yml = self.project_path / "_quarto.yml"
 
+        default_config = None
         if not quarto_yml.exists():
             print("Warning: _quarto.yml not found. Creating minimal configuration...")
-            config = {
-                "project": {"type": "website", "post-render": "scripts/post-render.py"},
-                "format": {"html": {"theme": "flatly", "css": ["great-docs.css"]}},
+            default_config = {
+                "project": {"type": "website", "post-render": _POST_RENDER_SCRIPT},
+                "format": {"html": {"theme": "flatly", "css": [_GREAT_DOCS_CSS]}},
             }
+
+        if self._rewrite_quarto_config(
+            self._apply_great_docs_config, *extra_mutations, default=default_config
+        ):
+            print(f"Updated {quarto_yml} with great-docs configuration")
         else:
-            # Load existing configuration
-            with open(quarto_yml, "r") as f:
-                config = yaml.safe_load(f) or {}
+            print(f"{quarto_yml} already has great-docs configuration")
 
+    def _apply_great_docs_config(self, config: dict) -> None:
+        """
+        Add the great-docs post-render script, styling, and site navigation to a config.
+
+        Parameters
+        ----------
+        config
+            The parsed _quarto.yml, modified in place.
+        """
         # Ensure required structure exists
-        if "project" not in config:
-            config["project"] = {}
-        if "format" not in config:
-            config["format"] = {}
-        if "html" not in config["format"]:
-            config["format"]["html"] = {}
+        _merge_missing(config, {"project": {}, "format": {"html": {}}})
 
         # Add post-render script
-        config["project"]["post-render"] = "scripts/post-render.py"
-
-        # Add CSS file
-        if "css" not in config["format"]["html"]:
-            config["format"]["html"]["css"] = []
-        elif isinstance(config["format"]["html"]["css"], str):
-            config["format"]["html"]["css"] = [config["format"]["html"]["css"]]
-
-        if "great-docs.css" not in config["format"]["html"]["css"]:
-            config["format"]["html"]["css"].append("great-docs.css")
-
-        # Ensure flatly theme is used (works well with great-docs)
-        if "theme" not in config["format"]["html"]:
-            config["format"]["html"]["theme"] = "flatly"
-
-        # Add table of contents configuration for API reference navigation
-        if "toc" not in config["format"]["html"]:
-            config["format"]["html"]["toc"] = True
-        if "toc-depth" not in config["format"]["html"]:
-            config["format"]["html"]["toc-depth"] = 2
-        if "toc-title" not in config["format"]["html"]:
-            config["format"]["html"]["toc-title"] = "On this page"
-        if "shift-heading-level-by" not in config["format"]["html"]:
-            config["format"]["html"]["shift-heading-level-by"] = -1
+        config["project"]["post-render"] = _POST_RENDER_SCRIPT
+
+        html = config["format"]["html"]
+
+        # Add CSS file (Quarto accepts a single stylesheet or a list of them)
+        css = html.get("css")
+        if css is None:
+            css = []
+        elif isinstance(css, str):
+            css = [css]
+        if _GREAT_DOCS_CSS not in css:
+            css.append(_GREAT_DOCS_CSS)
+        html["css"] = css
+
+        # Fill in any unset theme and table of contents settings
+        _merge_missing(html, _QUARTO_HTML_DEFAULTS)
 
         # Add Font Awesome for ORCID icon support
-        if "include-in-header" not in config["format"]["html"]:
-            config["format"]["html"]["include-in-header"] = []
-        elif isinstance(config["format"]["html"]["include-in-header"], str):
-            config["format"]["html"]["include-in-header"] = [
-                config["format"]["html"]["include-in-header"]
-            ]
+        headers = html.get("include-in-header")
+        if headers is None:
+            headers = []
+        elif isinstance(headers, str):
+            headers = [headers]
+        html["include-in-header"] = headers
 
         # Add Font Awesome CDN if not already present
         fa_cdn = '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">'
         fa_entry = {"text": fa_cdn}
-        if fa_entry not in config["format"]["html"]["include-in-header"]:
+        if fa_entry not in headers:
             # Check if any Font Awesome link already exists
-            has_fa = any(
-                "font-awesome" in str(item).lower()
-                for item in config["format"]["html"]["include-in-header"]
-            )
+            has_fa = any("font-awesome" in str(item).lower() for item in headers)
             if not has_fa:
-                config["format"]["html"]["include-in-header"].append(fa_entry)
-
-        # Add website navigation if not present
-        if "website" not in config:
-            config["website"] = {}
+                headers.append(fa_entry)
 
         # Enable page navigation for TOC
-        if "page-navigation" not in config["website"]:
-            config["website"]["page-navigation"] = True
+        website = config.setdefault("website", {})
+        website.setdefault("page-navigation", True)
 
         # Set title to package name if not already set
         if "title" not in config["website"]:
@@ -2393,13 +2914,8 @@ toc: false
             config["website"]["navbar"] = navbar_config
 
         # Add sidebar navigation for reference pages
-        if "sidebar" not in config["website"]:
-            config["website"]["sidebar"] = [
-                {
-                    "id": "reference",
-                    "contents": "reference/",
-                }
-            ]
+        if "sidebar" not in website:
+            website["sidebar"] = copy.deepcopy(_QUARTO_SIDEBAR_DEFAULT)
 
         # Add page footer with copyright notice if not present
         if "page-footer" not in config["website"]:
@@ -2420,12 +2936,6 @@ toc: false
             if author_name:
                 config["website"]["page-footer"] = {"left": f"&copy; {current_year} {author_name}"}
 
-        # Write back to file
-        with open(quarto_yml, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
-        print(f"Updated {quarto_yml} with great-docs configuration")
-
     def _update_sidebar_from_sections(self) -> None:
         """
         Update sidebar navigation based on quartodoc sections.
@@ -2433,14 +2943,17 @@ toc: false
         Builds a structured sidebar with sections and their contents,
         and excludes the index page from showing the sidebar.
         """
-        quarto_yml = self.project_path / "_quarto.yml"
+        self._rewrite_quarto_config(self._apply_sidebar_from_sections)
 
-        if not quarto_yml.exists():
-            return
-
-        with open(quarto_yml, "r") as f:
-            config = yaml.safe_load(f) or {}
+    def _apply_sidebar_from_sections(self, config: dict) -> None:
+        """
+        Build the reference sidebar of a parsed _quarto.yml from its quartodoc sections.
 
+        Parameters
+        ----------
+        config
+            The parsed _quarto.yml, modified in place.
+        """
         # Get quartodoc sections if they exist
         if "quartodoc" not in config or "sections" not in config["quartodoc"]:
             return
@@ -2478,10 +2991,6 @@ toc: false
             }
         ]
 
-        # Write back
-        with open(quarto_yml, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
     def _update_reference_index_frontmatter(self) -> None:
         """Ensure reference/index.qmd has proper frontmatter."""
         index_path = self.docs_dir / "reference" / "index.qmd"
@@ -2521,8 +3030,7 @@ toc: false
         if not quarto_yml.exists():
             return
 
-        with open(quarto_yml, "r") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(quarto_yml)
 
         # Get quartodoc sections and package info
         if "quartodoc" not in config:
@@ -2624,6 +3132,9 @@ toc: false
         """
         Get the first line of a docstring for an item.
 
+        The docstring is read from the griffe model of the package (shared with the rest
+        of the build), so the package itself is never imported.
+
         Parameters
         ----------
         package_name
@@ -2636,20 +3147,20 @@ toc: false
         str
             The first line of the docstring, or empty string if not available.
         """
-        try:
-            import importlib
+        if _get_griffe() is None:
+            return ""
 
-            # Normalize package name
-            normalized_name = package_name.replace("-", "_")
-            module = importlib.import_module(normalized_name)
+        try:
+            obj = self._load_griffe_package(self._normalize_package_name(package_name))
 
-            # Try to get the object
-            obj = getattr(module, item_name, None)
-            if obj is None:
-                return ""
+            # Navigate to the item (handle dotted names like "ClassName.method")
+            for part in item_name.split("."):
+                if part not in obj.members:
+                    return ""
+                obj = obj.members[part]
 
-            # Get docstring
-            docstring = getattr(obj, "__doc__", None)
+            # Accessing the docstring resolves aliases, which can fail for re-exports
+            docstring = obj.docstring.value if obj.docstring else None
             if not docstring:
                 return ""
 
@@ -2695,12 +3206,12 @@ toc: false
         install : Install great-docs assets and configuration
         """
         print("Uninstalling great-docs from your quartodoc project...")
-        print(f"Removing from: {self.project_path.relative_to(self.project_root)}")
+        print(f"Removing from: {self.docs_dir}")
 
         # Remove files
         files_to_remove = [
-            self.project_path / "scripts" / "post-render.py",
-            self.project_path / "great-docs.css",
+            self.project_path / _POST_RENDER_SCRIPT,
+            self.project_path / _GREAT_DOCS_CSS,
             self.project_path / ".gitignore",
         ]
 
@@ -2738,23 +3249,31 @@ toc: false
         if not quarto_yml.exists():
             return
 
-        with open(quarto_yml, "r") as f:
-            config = yaml.safe_load(f) or {}
+        # Nothing to clean (and no need to parse the YAML) if neither entry is mentioned
+        raw = quarto_yml.read_bytes()
+        if _POST_RENDER_SCRIPT.encode() not in raw and _GREAT_DOCS_CSS.encode() not in raw:
+            print(f"No great-docs configuration found in {quarto_yml}")
+            return
+
+        def remove_great_docs_config(config: dict) -> None:
+            # Remove post-render script if it's ours
+            project = config.get("project")
+            if isinstance(project, dict) and project.get("post-render") == _POST_RENDER_SCRIPT:
+                del project["post-render"]
 
-        # Remove post-render script if it's ours
-        if config.get("project", {}).get("post-render") == "scripts/post-render.py":
-            del config["project"]["post-render"]
+            # Remove CSS file
+            formats = config.get("format")
+            html = formats.get("html") if isinstance(formats, dict) else None
+            if not isinstance(html, dict):
+                return
 
-        # Remove CSS file
-        css_list = config.get("format", {}).get("html", {}).get("css", [])
-        if isinstance(css_list, list) and "great-docs.css" in css_list:
-            css_list.remove("great-docs.css")
-            if not css_list:
-                del config["format"]["html"]["css"]
+            css_list = html.get("css")
+            if isinstance(css_list, list) and _GREAT_DOCS_CSS in css_list:
+                css_list.remove(_GREAT_DOCS_CSS)
+                if not css_list:
+                    del html["css"]
 
-        # Write back to file
-        with open(quarto_yml, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        self._rewrite_quarto_config(remove_great_docs_config)
 
         print(f"Cleaned great-docs configuration from {quarto_yml}")
 
@@ -2799,110 +3318,79 @@ toc: false
         """
         import subprocess
         import sys
-        import threading
-        import time
-
-        def show_progress(stop_event, message):
-            """Show a simple spinner while command is running."""
-            spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            idx = 0
-            while not stop_event.is_set():
-                print(f"\r{message} {spinner[idx % len(spinner)]}", end="", flush=True)
-                idx += 1
-                time.sleep(0.1)
-            print(f"\r{message} ", end="", flush=True)
 
         print("Building documentation with great-docs...")
 
-        # Change to docs directory
-        original_dir = os.getcwd()
-        try:
-            os.chdir(self.project_path)
+        # Re-read the project's metadata and API on every build
+        self._reset_run_caches()
 
-            # Step 0: Rebuild index.qmd from source file (README.md, index.md, or index.qmd)
-            print("\n📄 Step 0: Syncing landing page with source file...")
-            self._create_index_from_readme(force_rebuild=True)
+        # Step 0: Rebuild index.qmd from source file (README.md, index.md, or index.qmd)
+        print("\n📄 Step 0: Syncing landing page with source file...")
+        self._create_index_from_readme(force_rebuild=True)
 
-            # Step 0.5: Refresh quartodoc config if requested
-            if refresh:
-                print("\n🔄 Refreshing quartodoc configuration...")
-                self._refresh_quartodoc_config()
+        # Step 0.5: Refresh quartodoc config if requested
+        if refresh:
+            print("\n🔄 Refreshing quartodoc configuration...")
+            self._refresh_quartodoc_config()
 
-            # Step 0.6: Generate llms.txt file
-            print("\n📝 Generating llms.txt...")
-            self._generate_llms_txt()
+        # Step 0.6: Generate llms.txt file
+        print("\n📝 Generating llms.txt...")
+        self._generate_llms_txt()
 
-            # Step 0.7: Generate source links JSON
-            print("\n🔗 Generating source links...")
-            package_name = self._detect_package_name()
-            if package_name:
-                self._generate_source_links_json(package_name)
-
-            # Step 1: Run quartodoc build using Python module execution
-            # This ensures it uses the same Python environment as great-docs
-            print("\n📚 Step 1: Generating API reference with quartodoc...")
+        # Step 0.7: Generate source links JSON
+        print("\n🔗 Generating source links...")
+        package_name = self._detect_package_name()
+        if package_name:
+            self._generate_source_links_json(package_name)
+
+        # Step 1: Run quartodoc build using Python module execution
+        # This ensures it uses the same Python environment as great-docs
+        print("\n📚 Step 1: Generating API reference with quartodoc...")
+
+        returncode, output = _run_with_output_tail(
+            [sys.executable, "-m", "quartodoc", "build"],
+            cwd=self.project_path,
+            progress_message="   Processing",
+        )
+
+        if returncode != 0:
+            print("\n❌ quartodoc build failed:")
+            # Check if quartodoc is not installed
+            if "No module named quartodoc" in output:
+                print("\n⚠️  quartodoc is not installed in your environment.")
+                print("\nTo fix this, install quartodoc:")
+                print(f"  {sys.executable} -m pip install quartodoc")
+                print("\nOr if using pip directly:")
+                print("  pip install quartodoc")
+            else:
+                print(output)
+            sys.exit(1)
+        else:
+            print("\n✅ API reference generated")
 
-            stop_event = threading.Event()
-            progress_thread = threading.Thread(
-                target=show_progress, args=(stop_event, "   Processing")
-            )
-            progress_thread.start()
+        # Step 2: Run quarto render or preview
+        if watch:
+            print("\n🔄 Step 2: Starting Quarto in watch mode...")
+            print("Press Ctrl+C to stop watching")
+            subprocess.run(["quarto", "preview", "--no-browser"], cwd=self.project_path)
+        else:
+            print("\n🔨 Step 2: Building site with Quarto...")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "quartodoc", "build"], capture_output=True, text=True
+            returncode, output = _run_with_output_tail(
+                ["quarto", "render"], cwd=self.project_path, progress_message="   Rendering"
             )
 
-            stop_event.set()
-            progress_thread.join()
-
-            if result.returncode != 0:
-                print("\n❌ quartodoc build failed:")
-                # Check if quartodoc is not installed
-                if "No module named quartodoc" in result.stderr:
-                    print("\n⚠️  quartodoc is not installed in your environment.")
-                    print("\nTo fix this, install quartodoc:")
-                    print(f"  {sys.executable} -m pip install quartodoc")
-                    print("\nOr if using pip directly:")
-                    print("  pip install quartodoc")
-                else:
-                    print(result.stderr)
+            if returncode != 0:
+                print("\n❌ quarto render failed:")
+                print(output)
                 sys.exit(1)
             else:
-                print("\n✅ API reference generated")
-
-            # Step 2: Run quarto render or preview
-            if watch:
-                print("\n🔄 Step 2: Starting Quarto in watch mode...")
-                print("Press Ctrl+C to stop watching")
-                subprocess.run(["quarto", "preview", "--no-browser"])
-            else:
-                print("\n🔨 Step 2: Building site with Quarto...")
-
-                stop_event = threading.Event()
-                progress_thread = threading.Thread(
-                    target=show_progress, args=(stop_event, "   Rendering")
-                )
-                progress_thread.start()
-
-                result = subprocess.run(["quarto", "render"], capture_output=True, text=True)
-
-                stop_event.set()
-                progress_thread.join()
-
-                if result.returncode != 0:
-                    print("\n❌ quarto render failed:")
-                    print(result.stderr)
-                    sys.exit(1)
+                print("\n✅ Site built successfully")
+                site_path = self.project_path / "_site" / "index.html"
+                if site_path.exists():
+                    print(f"\n🎉 Your site is ready! Open: {site_path}")
                 else:
-                    print("\n✅ Site built successfully")
-                    site_path = self.project_path / "_site" / "index.html"
-                    if site_path.exists():
-                        print(f"\n🎉 Your site is ready! Open: {site_path}")
-                    else:
-                        print(f"\n🎉 Your site is ready in: {self.project_path / '_site'}")
-
-        finally:
-            os.chdir(original_dir)
+                    print(f"\n🎉 Your site is ready in: {self.project_path / '_site'}")
 
     def preview(self) -> None:
         """
@@ -2926,36 +3414,145 @@ toc: false
 
         print("Building and previewing documentation...")
 
-        # Change to docs directory
-        original_dir = os.getcwd()
-        try:
-            os.chdir(self.project_path)
+        # Step 1: Run quartodoc build
+        print("\n📚 Step 1: Generating API reference with quartodoc...")
+        returncode, output = _run_with_output_tail(
+            [sys.executable, "-m", "quartodoc", "build"], cwd=self.project_path
+        )
+
+        if returncode != 0:
+            print("❌ quartodoc build failed:")
+            # Check if quartodoc is not installed
+            if "No module named quartodoc" in output:
+                print("\n⚠️  quartodoc is not installed in your environment.")
+                print("\nTo fix this, install quartodoc:")
+                print(f"  {sys.executable} -m pip install quartodoc")
+                print("\nOr if using pip directly:")
+                print("  pip install quartodoc")
+            else:
+                print(output)
+            return
+        else:
+            print("✅ API reference generated")
 
-            # Step 1: Run quartodoc build
-            print("\n📚 Step 1: Generating API reference with quartodoc...")
-            result = subprocess.run(
-                [sys.executable, "-m", "quartodoc", "build"], capture_output=True, text=True
-            )
+        # Step 2: Run quarto preview
+        print("\n🌐 Step 2: Starting preview server...")
+        print("Press Ctrl+C to stop the server")
+        subprocess.run(["quarto", "preview"], cwd=self.project_path)
 
-            if result.returncode != 0:
-                print("❌ quartodoc build failed:")
-                # Check if quartodoc is not installed
-                if "No module named quartodoc" in result.stderr:
-                    print("\n⚠️  quartodoc is not installed in your environment.")
-                    print("\nTo fix this, install quartodoc:")
-                    print(f"  {sys.executable} -m pip install quartodoc")
-                    print("\nOr if using pip directly:")
-                    print("  pip install quartodoc")
-                else:
-                    print(result.stderr)
-                return
-            else:
-                print("✅ API reference generated")
 
-            # Step 2: Run quarto preview
-            print("\n🌐 Step 2: Starting preview server...")
-            print("Press Ctrl+C to stop the server")
-            subprocess.run(["quarto", "preview"])
+class _PrefixedLineWriter:
+    """
+    Text stream that writes each complete line to `stream` with `prefix` in front.
+
+    Used for the output of a `build_all()` worker so that lines from concurrent builds
+    stay whole and say which project they came from. It reports that it isn't a
+    terminal, which turns off the progress spinner.
+    """
+
+    def __init__(self, stream, prefix: str):
+        self._stream = stream
+        self._prefix = prefix
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        *lines, self._pending = (self._pending + text).split("\n")
+        if lines:
+            self._stream.write("".join(f"{self._prefix}{line}\n" for line in lines))
+            self._stream.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        # Partial lines are held back until they are complete (or until close())
+        pass
+
+    def close(self) -> None:
+        """Write out any unfinished last line."""
+        if self._pending:
+            self.write("\n")
+
+    def isatty(self) -> bool:
+        return False
+
+
+def _build_project(project_path: str, docs_dir: str, refresh: bool) -> None:
+    """Build one project's docs (module-level so it can be pickled to a worker process)."""
+    import contextlib
+    import sys
+
+    out = _PrefixedLineWriter(sys.stdout, f"[{project_path}] ")
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            GreatDocs(project_path=project_path, docs_dir=docs_dir).build(refresh=refresh)
+    finally:
+        out.close()
+
+
+def build_all(
+    project_paths: list[str],
+    docs_dir: str | None = None,
+    refresh: bool = True,
+    max_workers: int | None = None,
+) -> None:
+    """
+    Build the documentation sites for several projects in parallel.
+
+    Each project is built by `GreatDocs.build()` in its own worker process, so the
+    quartodoc and Quarto runs for different projects (e.g., packages in a monorepo)
+    proceed concurrently. Output from the workers is printed line by line, with each
+    line prefixed by the path of the project it belongs to.
+
+    Parameters
+    ----------
+    project_paths
+        Paths to the project root directories to build.
+    docs_dir
+        Path to the documentation directory relative to each project root. If not
+        provided, it is detected for each project before any build starts (prompting
+        if needed, since the worker processes can't).
+    refresh
+        If True (default), re-discover package exports before building each project.
+    max_workers
+        Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the builds failed. All builds are run to completion first.
+
+    Examples
+    --------
+    Build the docs for two packages in a monorepo:
+
+    ```python
+    from great_docs import build_all
+
+    build_all(["packages/core", "packages/plugins"], docs_dir="docs")
+    ```
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    project_paths = [str(project_path) for project_path in project_paths]
+
+    # Workers have no usable stdin, so settle each project's docs directory here
+    docs_dirs = [
+        docs_dir if docs_dir is not None else str(GreatDocs(project_path=path).docs_dir)
+        for path in project_paths
+    ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_build_project, path, project_docs_dir, refresh)
+            for path, project_docs_dir in zip(project_paths, docs_dirs)
+        ]
+
+    failed = []
+    for project_path, future in zip(project_paths, futures):
+        try:
+            future.result()
+        except (Exception, SystemExit):
+            # build() reports its own errors and exits with sys.exit(1) on failure
+            failed.append(project_path)
 
-        finally:
-            os.chdir(original_dir)
+    if failed:
+        raise RuntimeError(f"Documentation build failed for: {', '.join(failed)}")
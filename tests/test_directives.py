@@ -1,5 +1,6 @@
 from great_docs._directives import (
     DocDirectives,
+    extract_and_strip,
     extract_directives,
     has_directives,
     strip_directives,
@@ -217,6 +218,12 @@ Parameters
         # Should not have more than 2 consecutive newlines
         assert "\n\n\n" not in result
 
+    def test_strip_without_directives_still_cleans_blank_lines(self):
+        """Test that a docstring with no % sign is tidied the same way."""
+        docstring = "\nShort description.\n\n\n\nParameters\n----------\n"
+        assert strip_directives(docstring) == "Short description.\n\nParameters\n----------"
+        assert extract_and_strip(docstring) == (DocDirectives(), strip_directives(docstring))
+
     def test_strip_from_none(self):
         """Test stripping from None returns empty string."""
         result = strip_directives(None)
@@ -272,6 +279,14 @@ class TestHasDirectives:
         """Test empty string returns False."""
         assert not has_directives("")
 
+    def test_marker_not_at_line_start(self):
+        """Test that a directive name in running text is not a directive."""
+        assert not has_directives("Use 100%family-friendly names.\n\n    Returns 50%order.")
+
+    def test_indented_directive(self):
+        """Test detecting an indented directive after other text."""
+        assert has_directives("Summary with 10% off.\n\n    %family Test\n")
+
 
 class TestDocDirectives:
     """Tests for DocDirectives dataclass."""
@@ -301,6 +316,13 @@ class TestDocDirectives:
         directives = DocDirectives(nodoc=True)
         assert directives
 
+    def test_uses_slots(self):
+        """Test that DocDirectives stores its fields in slots, not a per-instance dict."""
+        directives = DocDirectives(family="Tools", order=0)
+        assert not hasattr(directives, "__dict__")
+        assert directives
+        assert not DocDirectives(family="")
+
 
 class TestIntegration:
     """Integration tests combining extract and strip."""
@@ -343,3 +365,27 @@ class TestIntegration:
         assert "Validate column values" in cleaned
         assert "Parameters" in cleaned
         assert "Returns" in cleaned
+
+    def test_extract_and_strip_matches_separate_calls(self):
+        """Test the single-pass variant against extract_directives + strip_directives."""
+        docstrings = [
+            None,
+            "",
+            "Just a regular docstring.",
+            "Summary.\n\n    %family Tools\n    %order 2\n\n    Details.\n",
+            "Summary.\n%nodoc\n%seealso a, b\n\n\n\nMore.",
+            "%FAMILY Loud\n%family Quiet\n%order x\n%NODOC yes",
+        ]
+
+        for docstring in docstrings:
+            directives, cleaned = extract_and_strip(docstring)
+            assert directives == extract_directives(docstring)
+            assert cleaned == strip_directives(docstring)
+
+    def test_bare_directive_does_not_take_next_line(self):
+        """Test that a directive without a value doesn't read the following line."""
+        directives, cleaned = extract_and_strip("Summary.\n%family\n%order 3\n%family-ish text")
+
+        assert directives.family is None
+        assert directives.order == 3
+        assert cleaned == "Summary.\n%family-ish text"
@@ -2,9 +2,14 @@
 Basic tests for great-docs functionality.
 """
 
-import tempfile
 from pathlib import Path
+
+import great_docs
 from great_docs import GreatDocs
+from great_docs.core import _scan_string_list
+
+# Files that install() copies into the docs directory (and uninstall() removes)
+INSTALLED_ASSETS = ("scripts/post-render.py", "great-docs.css")
 
 
 def test_great_docs_init():
@@ -13,40 +18,174 @@ def test_great_docs_init():
     assert docs.project_root == Path.cwd()
 
 
-def test_great_docs_init_with_path():
+def test_great_docs_init_with_path(tmp_path):
     """Test GreatDocs initialization with custom path."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        assert docs.project_root == Path(tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    assert docs.project_root == tmp_path
 
 
-def test_install_creates_files():
+def test_install_creates_files(tmp_path):
     """Test that install creates the expected files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        docs.install(force=True, skip_quartodoc=True)
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs.install(force=True, skip_quartodoc=True)
+
+    # Check that files were created
+    missing = [
+        name for name in (*INSTALLED_ASSETS, "_quarto.yml") if not (tmp_path / name).exists()
+    ]
+    assert not missing, missing
+    assert not (tmp_path / "_quarto.yml.tmp").exists()
+
 
-        # Check that files were created
-        project_path = Path(tmp_dir)
-        assert (project_path / "scripts" / "post-render.py").exists()
-        assert (project_path / "great-docs.css").exists()
-        assert (project_path / "_quarto.yml").exists()
+def test_install_twice_leaves_assets_untouched(tmp_path):
+    """Test that re-running install skips assets that are already up to date."""
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs.install(skip_quartodoc=True)
 
+    css_file = tmp_path / "great-docs.css"
+    mtime = css_file.stat().st_mtime_ns
 
-def test_uninstall_removes_files():
+    # The copy keeps the bundled asset's mtime, so re-checking it needs no file reads
+    assets = Path(great_docs.__file__).parent / "assets"
+    assert mtime == (assets / "styles.css").stat().st_mtime_ns
+    gitignore = tmp_path / ".gitignore"
+    assert gitignore.stat().st_mtime_ns == (assets / ".gitignore").stat().st_mtime_ns
+
+    # No overwrite prompt is shown since the files match the bundled assets
+    docs.install(skip_quartodoc=True)
+    assert css_file.stat().st_mtime_ns == mtime
+
+
+def test_uninstall_removes_files(tmp_path):
     """Test that uninstall removes the docs files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+
+    # Install first
+    docs.install(force=True, skip_quartodoc=True)
+
+    missing = [name for name in INSTALLED_ASSETS if not (tmp_path / name).exists()]
+    assert not missing, missing
+
+    # Then uninstall
+    docs.uninstall()
+
+    left_behind = [name for name in INSTALLED_ASSETS if (tmp_path / name).exists()]
+    assert not left_behind, left_behind
+    assert not (tmp_path / ".gitignore").exists()
+
+
+def test_update_quarto_config_skips_unchanged_file(tmp_path):
+    """Test that re-applying the config leaves an up-to-date _quarto.yml untouched."""
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._update_quarto_config()
+
+    # Comments are dropped by a YAML round-trip, so this one survives only if
+    # the file is not rewritten
+    quarto_yml = tmp_path / "_quarto.yml"
+    content = "# My site config\n" + quarto_yml.read_text()
+    quarto_yml.write_text(content)
+
+    docs._update_quarto_config()
+    assert quarto_yml.read_text() == content
+
+
+def test_update_quarto_config_follows_symlink_and_keeps_mode(tmp_path):
+    """Test that a symlinked _quarto.yml stays a link and its target keeps its mode."""
+    import os
+    import stat
+
+    shared = tmp_path / "shared" / "_quarto.yml"
+    shared.parent.mkdir()
+    shared.write_text("project:\n  type: website\n")
+    shared.chmod(0o640)
+
+    site = tmp_path / "site"
+    site.mkdir()
+    os.symlink(shared, site / "_quarto.yml")
+
+    docs = GreatDocs(project_path=str(site), docs_dir=".")
+    docs._update_quarto_config()
+
+    assert (site / "_quarto.yml").is_symlink()
+    assert "great-docs.css" in shared.read_text()
+    assert stat.S_IMODE(shared.stat().st_mode) == 0o640
+    assert not (site / "_quarto.yml.tmp").exists()
+    assert not (shared.parent / "_quarto.yml.tmp").exists()
+
+
+def test_update_quarto_config_keeps_user_settings(tmp_path):
+    """Test that great-docs defaults only fill in settings the user hasn't made."""
+    import yaml
+
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text("format:\n  html:\n    theme: cosmo\n    toc: false\n")
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._update_quarto_config()
+
+    config = yaml.safe_load(quarto_yml.read_text())
+    html = config["format"]["html"]
+    assert html["theme"] == "cosmo"
+    assert html["toc"] is False
+    assert html["toc-depth"] == 2
+    assert html["css"] == ["great-docs.css"]
+    assert config["project"]["post-render"] == "scripts/post-render.py"
+    assert config["website"]["sidebar"] == [{"id": "reference", "contents": "reference/"}]
+
+
+def test_update_quarto_config_key_order(tmp_path):
+    """Test that settings are added to _quarto.yml in a stable order."""
+    import yaml
+
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "orderpkg"\n')
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text("project:\n  type: website\n")
 
-        # Install first
-        docs.install(force=True, skip_quartodoc=True)
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._update_quarto_config()
 
-        project_path = Path(tmp_dir)
-        assert (project_path / "scripts" / "post-render.py").exists()
-        assert (project_path / "great-docs.css").exists()
+    config = yaml.safe_load(quarto_yml.read_text())
+    assert list(config) == ["project", "format", "website"]
+    assert list(config["format"]["html"]) == [
+        "css",
+        "theme",
+        "toc",
+        "toc-depth",
+        "toc-title",
+        "shift-heading-level-by",
+        "include-in-header",
+    ]
+    assert list(config["website"]) == ["page-navigation", "title", "navbar", "sidebar"]
 
-        # Then uninstall
-        docs.uninstall()
+
+def test_uninstall_cleans_quarto_config(tmp_path):
+    """Test that uninstall removes the great-docs entries from _quarto.yml."""
+    import yaml
+
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text(
+        "project:\n  type: website\nformat:\n  html:\n    css:\n    - custom.css\n"
+    )
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs.install(force=True, skip_quartodoc=True)
+    docs.uninstall()
+
+    config = yaml.safe_load(quarto_yml.read_text())
+    assert "post-render" not in config["project"]
+    assert config["format"]["html"]["css"] == ["custom.css"]
+
+
+def test_clean_quarto_config_without_great_docs_entries(tmp_path):
+    """Test that cleaning a _quarto.yml with no great-docs entries leaves it untouched."""
+    quarto_yml = tmp_path / "_quarto.yml"
+    content = "# Hand-written config\nproject:\n  type: website\n"
+    quarto_yml.write_text(content)
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._clean_quarto_config()
+
+    assert quarto_yml.read_text() == content
 
 
 def test_parse_package_exports():
@@ -82,6 +221,49 @@ def test_detect_package_name_from_pyproject():
     assert package_name == "great-docs"
 
 
+def test_detect_package_name_from_pyproject_tables(tmp_path):
+    """Test that the name is read from [project] regardless of surrounding tables."""
+    pyproject = tmp_path / "pyproject.toml"
+
+    pyproject.write_text(
+        '[build-system]\nrequires = ["setuptools"]\n\n'
+        '[project]  # metadata\nname = "my-pkg"\nversion = "1.0"\n\n'
+        '[project.urls]\nhomepage = "https://example.com"\n\n'
+        "[tool.ruff]\nline-length = 100\n"
+    )
+    assert GreatDocs(project_path=str(tmp_path), docs_dir=".")._detect_package_name() == "my-pkg"
+
+    # Dotted keys outside a [project] table need the full parse
+    pyproject.write_text('project.name = "dotted-pkg"\n')
+    assert (
+        GreatDocs(project_path=str(tmp_path), docs_dir=".")._detect_package_name() == "dotted-pkg"
+    )
+
+
+def test_detect_package_name_from_setup_py(tmp_path):
+    """Test package name detection from setup.py."""
+    setup_py = tmp_path / "setup.py"
+    setup_py.write_text('from setuptools import setup\n\nsetup(name="my-pkg", version="1.0")\n')
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    assert docs._detect_package_name() == "my-pkg"
+
+
+def test_detect_package_name_from_single_package_dir(tmp_path):
+    """Test package name detection from a lone package directory."""
+    package_dir = tmp_path / "mypackage"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+
+    # Directories without __init__.py and hidden directories are ignored
+    (tmp_path / "data").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "__init__.py").write_text("")
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    assert docs._detect_package_name() == "mypackage"
+
+
 def test_find_package_init():
     """Test finding __init__.py in standard location."""
     docs = GreatDocs(docs_dir=".")
@@ -92,24 +274,21 @@ def test_find_package_init():
     assert init_file.name == "__init__.py"
 
 
-def test_find_package_init_with_nested_structure():
+def test_find_package_init_with_nested_structure(tmp_path):
     """Test finding __init__.py in nested directories like python/."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create a package structure in python/ subdirectory
-        python_dir = Path(tmp_dir) / "python"
-        python_dir.mkdir()
-        package_dir = python_dir / "mypackage"
-        package_dir.mkdir()
+    # Create a package structure in python/ subdirectory
+    package_dir = tmp_path / "python" / "mypackage"
+    package_dir.mkdir(parents=True)
 
-        # Create __init__.py with __version__ and __all__
-        init_file = package_dir / "__init__.py"
-        init_file.write_text('__version__ = "1.0.0"\n__all__ = ["MyClass"]')
+    # Create __init__.py with __version__ and __all__
+    init_file = package_dir / "__init__.py"
+    init_file.write_text('__version__ = "1.0.0"\n__all__ = ["MyClass"]')
 
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        found_init = docs._find_package_init("mypackage")
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    found_init = docs._find_package_init("mypackage")
 
-        assert found_init is not None
-        assert found_init == init_file
+    assert found_init is not None
+    assert found_init == init_file
 
 
 def test_cli_import():
@@ -119,17 +298,31 @@ def test_cli_import():
     assert callable(main)
 
 
-def test_method_section_generation():
+def test_package_import_defers_cli():
+    """Test that importing great_docs doesn't import click until `main` is used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, great_docs\n"
+        "assert 'click' not in sys.modules\n"
+        "from great_docs import main\n"
+        "from great_docs.cli import main as cli_main\n"
+        "assert main is cli_main and 'click' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_method_section_generation(tmp_path):
     """Test that classes with >5 methods get separate method sections."""
     import sys
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create a test package with a class that has many methods
-        package_dir = Path(tmp_dir) / "testpkg"
-        package_dir.mkdir()
+    # Create a test package with a class that has many methods
+    package_dir = tmp_path / "testpkg"
+    package_dir.mkdir()
 
-        # Create __init__.py with __all__ and a class with many methods
-        init_content = '''
+    # Create __init__.py with __all__ and a class with many methods
+    init_content = '''
 """Test package."""
 __version__ = "1.0.0"
 __all__ = ["BigClass", "SmallClass", "some_function"]
@@ -153,68 +346,67 @@ def some_function():
     """A function."""
     pass
 '''
-        (package_dir / "__init__.py").write_text(init_content)
-
-        # Add temp dir to sys.path so griffe can find the package
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-            sections = docs._create_quartodoc_sections("testpkg")
-
-            assert sections is not None
-
-            # Check that we have a Classes section
-            class_section = next((s for s in sections if s["title"] == "Classes"), None)
-            assert class_section is not None
-
-            # BigClass should have members: [] since it has >5 methods
-            big_class_entry = next(
-                (
-                    c
-                    for c in class_section["contents"]
-                    if isinstance(c, dict) and c.get("name") == "BigClass"
-                ),
-                None,
-            )
-            assert big_class_entry is not None
-            assert big_class_entry == {"name": "BigClass", "members": []}
-
-            # SmallClass should be a plain string (inline documentation)
-            assert "SmallClass" in class_section["contents"]
-
-            # Check that we have a separate method section for BigClass
-            method_section = next((s for s in sections if s["title"] == "BigClass Methods"), None)
-            assert method_section is not None
-            assert len(method_section["contents"]) == 7
-            assert "BigClass.method1" in method_section["contents"]
-            assert "BigClass.method7" in method_section["contents"]
-
-            # SmallClass should NOT have a separate method section
-            small_method_section = next(
-                (s for s in sections if s["title"] == "SmallClass Methods"), None
-            )
-            assert small_method_section is None
-
-            # Check that functions section exists
-            func_section = next((s for s in sections if s["title"] == "Functions"), None)
-            assert func_section is not None
-            assert "some_function" in func_section["contents"]
-        finally:
-            # Clean up sys.path
-            sys.path.remove(tmp_dir)
-
-
-def test_gt_exclude():
+    (package_dir / "__init__.py").write_text(init_content)
+
+    # Add temp dir to sys.path so griffe can find the package
+    sys.path.insert(0, str(tmp_path))
+    try:
+        docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+        sections = docs._create_quartodoc_sections("testpkg")
+
+        assert sections is not None
+
+        # Check that we have a Classes section
+        class_section = next((s for s in sections if s["title"] == "Classes"), None)
+        assert class_section is not None
+
+        # BigClass should have members: [] since it has >5 methods
+        big_class_entry = next(
+            (
+                c
+                for c in class_section["contents"]
+                if isinstance(c, dict) and c.get("name") == "BigClass"
+            ),
+            None,
+        )
+        assert big_class_entry is not None
+        assert big_class_entry == {"name": "BigClass", "members": []}
+
+        # SmallClass should be a plain string (inline documentation)
+        assert "SmallClass" in class_section["contents"]
+
+        # Check that we have a separate method section for BigClass
+        method_section = next((s for s in sections if s["title"] == "BigClass Methods"), None)
+        assert method_section is not None
+        assert len(method_section["contents"]) == 7
+        assert "BigClass.method1" in method_section["contents"]
+        assert "BigClass.method7" in method_section["contents"]
+
+        # SmallClass should NOT have a separate method section
+        small_method_section = next(
+            (s for s in sections if s["title"] == "SmallClass Methods"), None
+        )
+        assert small_method_section is None
+
+        # Check that functions section exists
+        func_section = next((s for s in sections if s["title"] == "Functions"), None)
+        assert func_section is not None
+        assert "some_function" in func_section["contents"]
+    finally:
+        # Clean up sys.path
+        sys.path.remove(str(tmp_path))
+
+
+def test_gt_exclude(tmp_path):
     """Test that __gt_exclude__ filters out non-documentable items."""
     import sys
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create a test package with __gt_exclude__
-        package_dir = Path(tmp_dir) / "testpkg_exclude"
-        package_dir.mkdir()
+    # Create a test package with __gt_exclude__
+    package_dir = tmp_path / "testpkg_exclude"
+    package_dir.mkdir()
 
-        # Create __init__.py with __all__ and __gt_exclude__
-        init_content = '''
+    # Create __init__.py with __all__ and __gt_exclude__
+    init_content = '''
 """Test package with exclusions."""
 __version__ = "1.0.0"
 __all__ = ["Graph", "Node", "Edge", "some_function"]
@@ -239,121 +431,131 @@ def some_function():
     """A function."""
     pass
 '''
-        (package_dir / "__init__.py").write_text(init_content)
+    (package_dir / "__init__.py").write_text(init_content)
 
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        exports = docs._parse_package_exports("testpkg_exclude")
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    exports = docs._parse_package_exports("testpkg_exclude")
 
-        # Should have filtered out Node and Edge
-        assert exports is not None
-        assert "Graph" in exports
-        assert "some_function" in exports
-        assert "Node" not in exports
-        assert "Edge" not in exports
-        assert len(exports) == 2
+    # Should have filtered out Node and Edge
+    assert exports is not None
+    assert "Graph" in exports
+    assert "some_function" in exports
+    assert "Node" not in exports
+    assert "Edge" not in exports
+    assert len(exports) == 2
 
 
-def test_setup_github_pages_command():
+def test_setup_github_pages_command(tmp_path):
     """Test the setup-github-pages CLI command."""
     from click.testing import CliRunner
     from great_docs.cli import setup_github_pages
 
     runner = CliRunner()
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Run the command
-        result = runner.invoke(setup_github_pages, ["--project-path", tmp_dir, "--force"])
+    # Run the command
+    result = runner.invoke(setup_github_pages, ["--project-path", str(tmp_path), "--force"])
 
-        # Check it succeeded
-        assert result.exit_code == 0
-        assert "✅ Created GitHub Actions workflow" in result.output
+    # Check it succeeded
+    assert result.exit_code == 0
+    assert "✅ Created GitHub Actions workflow" in result.output
 
-        # Check the file was created
-        workflow_file = Path(tmp_dir) / ".github" / "workflows" / "docs.yml"
-        assert workflow_file.exists()
+    # Check the file was created
+    workflow_file = tmp_path / ".github" / "workflows" / "docs.yml"
+    assert workflow_file.exists()
 
-        # Check the content is valid YAML and contains expected keys
-        import yaml
+    # Check the content is valid YAML and contains expected keys (BaseLoader keeps every
+    # scalar a string, as GitHub reads them; `on` would otherwise become the boolean True)
+    import yaml
 
-        with open(workflow_file) as f:
-            workflow = yaml.safe_load(f)
+    with open(workflow_file) as f:
+        workflow = yaml.load(f, Loader=yaml.BaseLoader)
 
-        assert "name" in workflow
-        assert workflow["name"] == "CI Docs"
-        assert "jobs" in workflow
-        assert "build-docs" in workflow["jobs"]
-        assert "publish-docs" in workflow["jobs"]
-        assert "preview-docs" in workflow["jobs"]
+    assert workflow["on"]["push"]["branches"] == ["main"]
+    assert "name" in workflow
+    assert workflow["name"] == "CI Docs"
+    assert "jobs" in workflow
+    assert "build-docs" in workflow["jobs"]
+    assert "publish-docs" in workflow["jobs"]
+    assert "preview-docs" in workflow["jobs"]
 
 
-def test_setup_github_pages_custom_options():
+def test_setup_github_pages_custom_options(tmp_path):
     """Test setup-github-pages with custom options."""
     from click.testing import CliRunner
     from great_docs.cli import setup_github_pages
 
     runner = CliRunner()
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        result = runner.invoke(
-            setup_github_pages,
-            [
-                "--project-path",
-                tmp_dir,
-                "--docs-dir",
-                "site",
-                "--main-branch",
-                "develop",
-                "--python-version",
-                "3.12",
-                "--force",
-            ],
-        )
-
-        assert result.exit_code == 0
-
-        workflow_file = Path(tmp_dir) / ".github" / "workflows" / "docs.yml"
-        content = workflow_file.read_text()
-
-        # Check customizations were applied
-        assert "site" in content
-        assert "develop" in content
-        assert "3.12" in content
-
-
-def test_setup_github_pages_overwrite_protection():
+    result = runner.invoke(
+        setup_github_pages,
+        [
+            "--project-path",
+            str(tmp_path),
+            "--docs-dir",
+            "site",
+            "--main-branch",
+            "develop",
+            "--python-version",
+            "3.12",
+            "--force",
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    import yaml
+
+    workflow_file = tmp_path / ".github" / "workflows" / "docs.yml"
+    with open(workflow_file) as f:
+        workflow = yaml.load(f, Loader=yaml.BaseLoader)
+
+    # Check customizations were applied where they belong
+    steps = workflow["jobs"]["build-docs"]["steps"]
+    setup_python = next(s for s in steps if s.get("uses", "").startswith("actions/setup-python"))
+    build_step = next(s for s in steps if s.get("name") == "Build docs")
+    upload_step = next(s for s in steps if s.get("uses", "").startswith("actions/upload-artifact"))
+    assert setup_python["with"]["python-version"] == "3.12"
+    assert "cd site\n" in build_step["run"]
+    assert upload_step["with"]["path"] == "site/_site"
+    assert workflow["on"]["push"]["branches"] == ["develop"]
+    assert workflow["jobs"]["publish-docs"]["if"] == "github.ref == 'refs/heads/develop'"
+
+
+def test_setup_github_pages_overwrite_protection(tmp_path):
     """Test that setup-github-pages protects against overwrites."""
     from click.testing import CliRunner
     from great_docs.cli import setup_github_pages
 
     runner = CliRunner()
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create the workflow first
-        runner.invoke(setup_github_pages, ["--project-path", tmp_dir, "--force"])
+    # An existing workflow (written directly; only the prompt is under test here)
+    workflow_file = tmp_path / ".github" / "workflows" / "docs.yml"
+    workflow_file.parent.mkdir(parents=True)
+    workflow_file.write_text("name: Existing\n")
 
-        # Try again without force
-        result = runner.invoke(setup_github_pages, ["--project-path", tmp_dir], input="n\n")
+    # Try to create it without force, declining the overwrite
+    result = runner.invoke(setup_github_pages, ["--project-path", str(tmp_path)], input="n\n")
 
-        assert result.exit_code == 1
-        assert "Aborted" in result.output
+    assert result.exit_code == 1
+    assert "Aborted" in result.output
+    assert workflow_file.read_text() == "name: Existing\n"
 
 
-def test_generate_llms_txt():
+def test_generate_llms_txt(tmp_path):
     """Test generation of llms.txt file."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
 
-        # Create a pyproject.toml with package info
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text("""
+    # Create a pyproject.toml with package info
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("""
 [project]
 name = "test-package"
 description = "A test package"
 """)
 
-        # Create a minimal _quarto.yml with quartodoc config
-        quarto_yml = Path(tmp_dir) / "_quarto.yml"
-        quarto_yml.write_text("""
+    # Create a minimal _quarto.yml with quartodoc config
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text("""
 quartodoc:
   package: test_package
   sections:
@@ -367,35 +569,34 @@ quartodoc:
         - MyClass
 """)
 
-        # Generate llms.txt
-        docs._generate_llms_txt()
+    # Generate llms.txt
+    docs._generate_llms_txt()
 
-        # Check the file was created
-        llms_txt = Path(tmp_dir) / "llms.txt"
-        assert llms_txt.exists()
+    # Check the file was created
+    llms_txt = tmp_path / "llms.txt"
+    assert llms_txt.exists()
 
-        # Check content structure
-        content = llms_txt.read_text()
-        assert "# test_package" in content
-        assert "> A test package" in content
-        assert "## Docs" in content
-        assert "### API Reference" in content
-        assert "#### Main" in content
-        assert "> Main functions" in content
-        assert "- [foo](reference/foo.html)" in content
-        assert "- [bar](reference/bar.html)" in content
-        assert "#### Classes" in content
-        assert "- [MyClass](reference/MyClass.html)" in content
+    # Check content structure
+    content = llms_txt.read_text()
+    assert "# test_package" in content
+    assert "> A test package" in content
+    assert "## Docs" in content
+    assert "### API Reference" in content
+    assert "#### Main" in content
+    assert "> Main functions" in content
+    assert "- [foo](reference/foo.html)" in content
+    assert "- [bar](reference/bar.html)" in content
+    assert "#### Classes" in content
+    assert "- [MyClass](reference/MyClass.html)" in content
 
 
-def test_generate_llms_txt_with_site_url():
+def test_generate_llms_txt_with_site_url(tmp_path):
     """Test llms.txt generation with site URL."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
 
-        # Create a minimal _quarto.yml with quartodoc config and site URL
-        quarto_yml = Path(tmp_dir) / "_quarto.yml"
-        quarto_yml.write_text("""
+    # Create a minimal _quarto.yml with quartodoc config and site URL
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text("""
 website:
   site-url: https://example.com/docs
 quartodoc:
@@ -406,13 +607,13 @@ quartodoc:
         - foo
 """)
 
-        # Generate llms.txt
-        docs._generate_llms_txt()
+    # Generate llms.txt
+    docs._generate_llms_txt()
 
-        # Check the file was created with absolute URLs
-        llms_txt = Path(tmp_dir) / "llms.txt"
-        content = llms_txt.read_text()
-        assert "https://example.com/docs/reference/foo.html" in content
+    # Check the file was created with absolute URLs
+    llms_txt = tmp_path / "llms.txt"
+    content = llms_txt.read_text()
+    assert "https://example.com/docs/reference/foo.html" in content
 
 
 def test_get_github_repo_info():
@@ -426,23 +627,22 @@ def test_get_github_repo_info():
     assert base_url == "https://github.com/rich-iannone/great-docs"
 
 
-def test_get_github_repo_info_no_repo():
+def test_get_github_repo_info_no_repo(tmp_path):
     """Test GitHub repo info when no repository URL exists."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create a minimal pyproject.toml without repository URL
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text("""
+    # Create a minimal pyproject.toml without repository URL
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("""
 [project]
 name = "test-package"
 version = "0.1.0"
 """)
 
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        owner, repo, base_url = docs._get_github_repo_info()
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    owner, repo, base_url = docs._get_github_repo_info()
 
-        assert owner is None
-        assert repo is None
-        assert base_url is None
+    assert owner is None
+    assert repo is None
+    assert base_url is None
 
 
 def test_get_source_location():
@@ -514,33 +714,31 @@ def test_build_github_source_url_single_line():
     assert "#L42-L42" not in url
 
 
-def test_source_link_config_defaults():
+def test_source_link_config_defaults(tmp_path):
     """Test that source link configuration has proper defaults."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create pyproject.toml without source config
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text("""
+    # Create pyproject.toml without source config
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("""
 [project]
 name = "test-package"
 version = "0.1.0"
 """)
 
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        metadata = docs._get_package_metadata()
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    metadata = docs._get_package_metadata()
 
-        # Defaults should be: enabled=True, branch=None, path=None, placement="usage"
-        assert metadata.get("source_link_enabled", True) is True
-        assert metadata.get("source_link_branch") is None
-        assert metadata.get("source_link_path") is None
-        assert metadata.get("source_link_placement", "usage") == "usage"
+    # Defaults should be: enabled=True, branch=None, path=None, placement="usage"
+    assert metadata.get("source_link_enabled", True) is True
+    assert metadata.get("source_link_branch") is None
+    assert metadata.get("source_link_path") is None
+    assert metadata.get("source_link_placement", "usage") == "usage"
 
 
-def test_source_link_config_custom():
+def test_source_link_config_custom(tmp_path):
     """Test custom source link configuration."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create pyproject.toml with custom source config
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text("""
+    # Create pyproject.toml with custom source config
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("""
 [project]
 name = "test-package"
 version = "0.1.0"
@@ -552,10 +750,436 @@ path = "src/mypackage"
 placement = "title"
 """)
 
-        docs = GreatDocs(project_path=tmp_dir, docs_dir=".")
-        metadata = docs._get_package_metadata()
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    metadata = docs._get_package_metadata()
+
+    assert metadata.get("source_link_enabled") is False
+    assert metadata.get("source_link_branch") == "develop"
+    assert metadata.get("source_link_path") == "src/mypackage"
+    assert metadata.get("source_link_placement") == "title"
+
+
+def test_install_appends_to_existing_gitignore(tmp_path):
+    """Test that install appends to a user .gitignore lacking the _site/ entry."""
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.pyc\n")
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs.install(skip_quartodoc=True)
+
+    content = gitignore.read_text()
+    assert content.startswith("*.pyc\n")
+    assert "_site/" in content
+
+
+def test_load_yaml_cache_tracks_file_changes(tmp_path):
+    """Test that cached YAML parses are isolated copies and refresh when the file changes."""
+    from great_docs.core import _load_yaml
+
+    config_file = tmp_path / "_quarto.yml"
+    config_file.write_text("project:\n  type: website\n")
+
+    config = _load_yaml(config_file)
+    assert config == {"project": {"type": "website"}}
+
+    # Mutating a returned config must not leak into later loads
+    config["project"]["type"] = "book"
+    assert _load_yaml(config_file) == {"project": {"type": "website"}}
+
+    # Editing the file on disk invalidates the cached parse
+    config_file.write_text("project:\n  type: default\n  output-dir: _build\n")
+    assert _load_yaml(config_file) == {"project": {"type": "default", "output-dir": "_build"}}
+
+
+def test_run_with_output_tail():
+    """Test that command output is captured as a bounded tail of stdout and stderr."""
+    import sys
+
+    from great_docs.core import _run_with_output_tail
+
+    script = "import sys\nfor i in range(10): print(i)\nsys.stderr.write('boom\\n')\nsys.exit(3)"
+    returncode, output = _run_with_output_tail([sys.executable, "-c", script], max_lines=3)
+
+    assert returncode == 3
+    assert output.splitlines() == ["8", "9", "boom"]
+
+
+def test_update_sidebar_from_sections(tmp_path):
+    """Test that the reference sidebar mirrors the quartodoc sections."""
+    import yaml
+
+    quarto_yml = tmp_path / "_quarto.yml"
+    quarto_yml.write_text("""
+quartodoc:
+  package: test_package
+  sections:
+    - title: Classes
+      contents:
+        - name: BigClass
+          members: []
+        - SmallClass
+""")
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._update_sidebar_from_sections()
+
+    config = yaml.safe_load(quarto_yml.read_text())
+    assert config["website"]["sidebar"] == [
+        {
+            "id": "reference",
+            "contents": [
+                {
+                    "section": "Classes",
+                    "contents": ["reference/BigClass.qmd", "reference/SmallClass.qmd"],
+                }
+            ],
+        }
+    ]
+
+    # Running it again doesn't rewrite the file
+    mtime = quarto_yml.stat().st_mtime_ns
+    docs._update_sidebar_from_sections()
+    assert quarto_yml.stat().st_mtime_ns == mtime
+
+
+def test_load_griffe_package_is_reused_within_a_run():
+    """Test that the griffe model of a package is loaded once and reused."""
+    docs = GreatDocs(docs_dir=".")
+
+    pkg = docs._load_griffe_package("great_docs")
+    assert "GreatDocs" in pkg.members
+    assert docs._load_griffe_package("great_docs") is pkg
+
+    # Starting a new run drops the cached model
+    docs._griffe_packages.clear()
+    assert docs._load_griffe_package("great_docs") is not pkg
+
+
+def test_griffe_unavailable_is_handled_in_one_place(monkeypatch):
+    """Test that griffe-based helpers degrade gracefully when griffe isn't installed."""
+    import pytest
+
+    import great_docs.core
+
+    monkeypatch.setattr(great_docs.core, "_get_griffe", lambda: None)
+    docs = GreatDocs(docs_dir=".")
+
+    with pytest.raises(ImportError):
+        docs._load_griffe_package("great_docs")
+    assert docs._discover_package_exports("great_docs") is None
+    assert docs._get_source_location("great_docs", "GreatDocs") is None
+    assert docs._extract_all_directives("great_docs") == {}
+
+
+def test_parse_package_exports_literal_and_computed_all(tmp_path):
+    """Test __all__ parsing for plain list literals and for forms needing a full parse."""
+    package_dir = tmp_path / "scanpkg"
+    package_dir.mkdir()
+    init_file = package_dir / "__init__.py"
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+
+    # A plain list literal (with comments) is read without parsing the module
+    init_file.write_text(
+        '"""Docs mentioning nothing special."""\n\n'
+        "__all__ = [\n"
+        '    "alpha",  # first\n'
+        '    "beta",\n'
+        "]\n"
+    )
+    assert docs._parse_package_exports("scanpkg") == ["alpha", "beta"]
+
+    # A reassigned __all__ falls back to the AST
+    init_file.write_text('__all__ = ["alpha"]\n__all__ = ["gamma"]\n')
+    assert docs._parse_package_exports("scanpkg") == ["gamma"]
+
+    # Lists with brackets inside strings fall back as well
+    init_file.write_text('__all__ = ["a]b", "c"]\n__gt_exclude__ = ["c"]\n')
+    assert docs._parse_package_exports("scanpkg") == ["a]b"]
+
+    # Tuples and += extensions are understood; assignments in functions are not exports
+    init_file.write_text(
+        '__all__ = ("alpha",)\n'
+        "try:\n"
+        '    __all__ += ["beta"]\n'
+        "except NameError:\n"
+        "    pass\n\n"
+        "def helper():\n"
+        '    __all__ = ["local"]\n'
+    )
+    assert docs._parse_package_exports("scanpkg") == ["alpha", "beta"]
+
+    # A list that is only part of the right-hand side is not taken at face value
+    for computed in ('["a", "b"] + extra', '["a"] if X else ["b"]'):
+        source = f"__all__ = {computed}\n".encode()
+        assert _scan_string_list(source, "__all__") is None
+        assert docs._parse_export_lists(source) == (None, [])
+        init_file.write_bytes(source)
+        assert docs._parse_package_exports("scanpkg") is None
+
+
+def test_find_docs_dir_with_existing_quarto_project(tmp_path):
+    """Test that an existing Quarto project is found in a common docs directory."""
+    # A docs directory without _quarto.yml is passed over for one that has it
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "site").mkdir()
+    (tmp_path / "site" / "_quarto.yml").write_text("project:\n  type: website\n")
+
+    docs = GreatDocs(project_path=str(tmp_path))
+    assert docs.docs_dir == Path("site")
+
+    # A root-level _quarto.yml is used when no docs directory has one
+    (tmp_path / "site" / "_quarto.yml").unlink()
+    (tmp_path / "_quarto.yml").write_text("project:\n  type: website\n")
+
+    docs = GreatDocs(project_path=str(tmp_path))
+    assert docs.docs_dir == Path(".")
+
+
+def test_create_index_from_readme_shifts_headings(tmp_path):
+    """Test that README headings are bumped down one level in index.qmd."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "readme-pkg"\n')
+    (tmp_path / "README.md").write_text(
+        "# Title\n\nIntro with a #hashtag.\n\n## Usage\n\n###### Deepest\n"
+    )
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir="docs")
+    docs.project_path.mkdir()
+    docs._create_index_from_readme()
+
+    content = (docs.project_path / "index.qmd").read_text()
+    assert "## Title" in content
+    assert "### Usage" in content
+    assert "####### Deepest" in content
+    assert "Intro with a #hashtag." in content
+
+
+def test_install_writes_quartodoc_config_and_sidebar(tmp_path):
+    """Test that install adds great-docs settings, quartodoc config, and sidebar together."""
+    import sys
+
+    import yaml
+
+    package_dir = tmp_path / "installpkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        '__all__ = ["Widget", "make_widget"]\n\n'
+        "class Widget:\n"
+        '    """A widget."""\n\n'
+        "    def spin(self):\n"
+        '        """Spin it."""\n\n\n'
+        "def make_widget():\n"
+        '    """Make a widget."""\n'
+    )
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "installpkg"\n')
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        docs = GreatDocs(project_path=str(tmp_path), docs_dir="docs")
+        docs.install(force=True)
+    finally:
+        sys.path.remove(str(tmp_path))
+
+    config = yaml.safe_load((docs.project_path / "_quarto.yml").read_text())
+
+    assert config["project"]["post-render"] == "scripts/post-render.py"
+    assert config["quartodoc"]["package"] == "installpkg"
+
+    sidebar_contents = config["website"]["sidebar"][0]["contents"]
+    sidebar_pages = [page for section in sidebar_contents for page in section["contents"]]
+    assert "reference/Widget.qmd" in sidebar_pages
+    assert "reference/make_widget.qmd" in sidebar_pages
+
+
+def test_get_docstring_summary_reads_source_without_importing(tmp_path):
+    """Test that docstring summaries come from the package source, not an import."""
+    import sys
+
+    package_dir = tmp_path / "summarypkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        'raise ImportError("importing this package is not allowed")\n\n'
+        'DEFAULT_NAME = "widget"\n\n\n'
+        "class Widget:\n"
+        '    """A widget for testing.\n\n    More details here.\n    """\n'
+    )
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+        assert docs._get_docstring_summary("summarypkg", "Widget") == "A widget for testing"
+        # Plain data has no docstring of its own (at runtime it would report str's)
+        assert docs._get_docstring_summary("summarypkg", "DEFAULT_NAME") == ""
+        assert "summarypkg" not in sys.modules
+    finally:
+        sys.path.remove(str(tmp_path))
+
+
+def test_is_yes():
+    """Test interpretation of yes/no prompt answers."""
+    from great_docs.core import _is_yes
+
+    # [y/N] prompts
+    assert _is_yes("y", default=False)
+    assert _is_yes(" Yes ", default=False)
+    assert not _is_yes("", default=False)
+    assert not _is_yes("maybe", default=False)
+
+    # [Y/n] prompts
+    assert _is_yes("", default=True)
+    assert _is_yes("sure", default=True)
+    assert not _is_yes("no", default=True)
+    assert not _is_yes("N", default=True)
+
+
+def test_package_metadata_is_reused_until_next_run(tmp_path):
+    """Test that pyproject.toml metadata is read once per install or build."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "meta-pkg"\ndescription = "First"\n')
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    assert docs._get_package_metadata()["description"] == "First"
+    assert docs._detect_package_name() == "meta-pkg"
+
+    pyproject.write_text('[project]\nname = "renamed-pkg"\ndescription = "Second"\n')
+    assert docs._get_package_metadata()["description"] == "First"
+    assert docs._detect_package_name() == "meta-pkg"
+
+    # The package name is refreshed along with the rest of the metadata
+    docs._reset_run_caches()
+    assert docs._get_package_metadata()["description"] == "Second"
+    assert docs._detect_package_name() == "renamed-pkg"
+
+
+def test_generate_source_links_json_includes_class_methods(tmp_path):
+    """Test that source links cover exported functions, classes, and their methods."""
+    import json
+    import sys
+
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "linkpkg"\n\n'
+        '[project.urls]\nRepository = "https://github.com/owner/linkpkg"\n'
+    )
+    package_dir = tmp_path / "linkpkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        '__all__ = ["Widget", "make_widget"]\n\n\n'
+        "class Widget:\n"
+        "    def spin(self):\n"
+        "        pass\n\n"
+        "    def _hidden(self):\n"
+        "        pass\n\n\n"
+        "def make_widget():\n"
+        "    return Widget()\n"
+    )
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+        docs._generate_source_links_json("linkpkg")
+    finally:
+        sys.path.remove(str(tmp_path))
+
+    links = json.loads((tmp_path / "_source_links.json").read_text())
+    assert sorted(links) == ["Widget", "Widget.spin", "make_widget"]
+    assert links["Widget.spin"]["start_line"] == 5
+    assert links["make_widget"]["url"].startswith("https://github.com/owner/linkpkg/blob/")
+
+
+def test_create_index_writes_citation_page(tmp_path):
+    """Test that CITATION.cff becomes an authors and citation page."""
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "citepkg"\n\n[tool.great-docs]\n'
+        'authors = [{name = "Ada Lovelace", role = "Maintainer"}]\n'
+    )
+    (tmp_path / "README.md").write_text("# citepkg\n\nHello.\n")
+    (tmp_path / "CITATION.cff").write_text(
+        "cff-version: 1.2.0\ntitle: Cite Pkg\nversion: 1.0\nurl: https://example.org\n"
+        "authors:\n  - given-names: Ada\n    family-names: Lovelace\n"
+        "  - family-names: Solo\n"
+    )
+
+    docs = GreatDocs(project_path=str(tmp_path), docs_dir=".")
+    docs._create_index_from_readme()
+
+    content = (tmp_path / "citation.qmd").read_text()
+    assert "## Authors\n\nAda Lovelace. Maintainer.  \nSolo. Author.  \n" in content
+    assert "Lovelace A, Solo (2025). Cite Pkg Python package version 1.0" in content
+    assert "  author = {Ada Lovelace and Solo},\n" in content
+    assert content.rstrip().endswith("}\n```")
+
+
+def test_build_all_reports_failed_projects(tmp_path, monkeypatch):
+    """Test that build_all runs every project and names the ones that failed."""
+    import concurrent.futures
+
+    import pytest
+
+    import great_docs.core
+
+    calls = []
+
+    def fake_build(project_path, docs_dir, refresh):
+        calls.append((project_path, docs_dir, refresh))
+        if project_path.endswith("bad"):
+            raise SystemExit(1)
+
+    monkeypatch.setattr(
+        concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor
+    )
+    monkeypatch.setattr(great_docs.core, "_build_project", fake_build)
+
+    names = ["ok", "bad", "also-ok", "also-bad"]
+    paths = (str(tmp_path / name) for name in names)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        great_docs.build_all(paths, docs_dir="docs", refresh=False)
+
+    message = str(excinfo.value)
+    assert str(tmp_path / "bad") in message
+    assert str(tmp_path / "also-bad") in message
+    assert str(tmp_path / "ok") + "," not in message
+    assert sorted(calls) == sorted((str(tmp_path / name), "docs", False) for name in names)
+
+
+def test_build_all_resolves_docs_dirs_before_building(tmp_path, monkeypatch):
+    """Test that build_all detects each docs directory up front and passes it on."""
+    import concurrent.futures
+
+    import great_docs.core
+
+    calls = []
+    monkeypatch.setattr(
+        concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor
+    )
+    monkeypatch.setattr(great_docs.core, "_build_project", lambda *args: calls.append(args))
+
+    root_site = tmp_path / "root-site"
+    root_site.mkdir()
+    (root_site / "_quarto.yml").write_text("project:\n  type: website\n")
+    docs_site = tmp_path / "docs-site"
+    (docs_site / "docs").mkdir(parents=True)
+    (docs_site / "docs" / "_quarto.yml").write_text("project:\n  type: website\n")
+
+    great_docs.build_all([root_site, docs_site])
+
+    assert sorted(calls) == sorted([(str(root_site), ".", True), (str(docs_site), "docs", True)])
+
+
+def test_prefixed_line_writer_keeps_lines_whole():
+    """Test that worker output is written as whole lines tagged with the project."""
+    import io
+
+    from great_docs.core import _PrefixedLineWriter
+
+    stream = io.StringIO()
+    out = _PrefixedLineWriter(stream, "[pkg] ")
+    out.write("Running quartodoc... ")
+    assert stream.getvalue() == ""
+
+    out.write("done\nsecond line\npartial")
+    out.close()
 
-        assert metadata.get("source_link_enabled") is False
-        assert metadata.get("source_link_branch") == "develop"
-        assert metadata.get("source_link_path") == "src/mypackage"
-        assert metadata.get("source_link_placement") == "title"
+    assert (
+        stream.getvalue() == "[pkg] Running quartodoc... done\n[pkg] second line\n[pkg] partial\n"
+    )
+    assert not out.isatty()